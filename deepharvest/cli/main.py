@@ -4,13 +4,127 @@ Command-Line Interface for DeepHarvest
 
 import click
 import asyncio
-import yaml
 from pathlib import Path
-import json
+import hashlib
 import logging
+import os
+import pickle
 import sys
 
 
+def _config_cache_dir() -> Path:
+    """Directory holding parsed-config caches"""
+    try:
+        import platformdirs
+
+        return Path(platformdirs.user_cache_dir("deepharvest"))
+    except ImportError:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "deepharvest"
+
+
+def _load_config(path) -> dict:
+    """Load a YAML (or .json) config file, reusing a pickled parse while the file is unchanged"""
+    path = Path(path).resolve()
+    st = path.stat()
+    key = hashlib.sha256(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()
+    cache_file = _config_cache_dir() / f"{key}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+
+    if path.suffix.lower() == ".json":
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            import orjson
+
+            cfg = orjson.loads(data) or {}
+        except ImportError:
+            import json
+
+            cfg = json.loads(data) or {}
+    else:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml if compiled in
+        with open(path) as f:
+            cfg = yaml.load(f, Loader=loader) or {}
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(cfg, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is best-effort (e.g. read-only home)
+
+    return cfg
+
+
+def _configure_logging(level: int = logging.INFO):
+    """
+    Route log records through a queue drained by a background thread, so crawl
+    coroutines never block on stdout. Returns the (listener, handler) pair to
+    pass to _stop_logging, or None if logging was already configured.
+    """
+    import logging.handlers
+    import queue
+
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener, queue_handler
+
+
+def _stop_logging(configured):
+    """
+    Flush and stop logging set up by _configure_logging, removing its handler
+    so a later in-process run configures logging afresh
+    """
+    if configured:
+        listener, queue_handler = configured
+        logging.getLogger().removeHandler(queue_handler)
+        listener.stop()
+
+
+def _run_async(coro, use_uvloop: bool = True):
+    """Run a coroutine to completion, on uvloop's event loop when available"""
+    if use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            uvloop = None
+
+        if uvloop is not None:
+            if sys.version_info >= (3, 11):
+                with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                    return runner.run(coro)
+            uvloop.install()
+
+    return asyncio.run(coro)
+
+
+def _enable_eager_tasks():
+    """Run new tasks eagerly until their first suspension (Python 3.12+, no-op otherwise)"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+
 @click.group()
 @click.version_option(version="1.0.4")
 def cli():
@@ -33,6 +147,9 @@ def cli():
     "--max-pages-per-domain", type=int, default=None, help="Maximum pages to crawl per domain"
 )
 @click.option("--time-limit", type=int, default=None, help="Maximum crawl time in seconds")
+@click.option(
+    "--uvloop/--no-uvloop", "use_uvloop", default=True, help="Use uvloop event loop if installed"
+)
 def crawl(
     urls,
     config,
@@ -46,6 +163,7 @@ def crawl(
     max_size,
     max_pages_per_domain,
     time_limit,
+    use_uvloop,
 ):
     """Start crawling URLs"""
 
@@ -53,11 +171,7 @@ def crawl(
     click.echo(f"Crawling {len(urls)} seed URL(s)")
 
     # Load config
-    if config:
-        with open(config) as f:
-            cfg = yaml.safe_load(f)
-    else:
-        cfg = {}
+    cfg = _load_config(config) if config else {}
 
     # Override with CLI options
     if depth:
@@ -80,7 +194,7 @@ def crawl(
         return
 
     # Configure logging
-    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    log_setup = _configure_logging()
 
     # Run crawler
     async def run():
@@ -92,6 +206,7 @@ def crawl(
             crawl_config.redis_url = redis_url
 
         crawler = DeepHarvest(crawl_config)
+        _enable_eager_tasks()
 
         try:
             click.echo("Initializing crawler...")
@@ -111,7 +226,10 @@ def crawl(
         finally:
             await crawler.shutdown()
 
-    asyncio.run(run())
+    try:
+        _run_async(run(), use_uvloop)
+    finally:
+        _stop_logging(log_setup)
 
     click.echo("Crawl completed!")
 
@@ -134,13 +252,20 @@ def resume(state_file, config, output):
 
     click.echo(f"Resuming crawl from {state_file}")
 
+    try:
+        import orjson as json_loader
+    except ImportError:
+        import json as json_loader
+
     # Load checkpoint state to get basic info
     try:
-        with open(state_file) as f:
-            checkpoint_state = json.load(f)
+        with open(state_file, "rb") as f:
+            checkpoint_state = json_loader.loads(f.read())
 
         processed = checkpoint_state.get("processed", 0)
-        visited_count = len(checkpoint_state.get("visited", []))
+        visited_count = checkpoint_state.get(
+            "visited_count", len(checkpoint_state.get("visited", []))
+        )
         frontier_count = len(checkpoint_state.get("frontier", []))
 
         click.echo(f"  Processed: {processed} URLs")
@@ -155,8 +280,7 @@ def resume(state_file, config, output):
     # Load config if provided, otherwise use defaults
     cfg = {}
     if config:
-        with open(config) as f:
-            cfg = yaml.safe_load(f)
+        cfg = _load_config(config)
 
     # Override state_file and output_dir to match resume request
     cfg["state_file"] = state_file
@@ -164,7 +288,7 @@ def resume(state_file, config, output):
         cfg["output_dir"] = output
 
     # Configure logging
-    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    log_setup = _configure_logging()
 
     # Run crawler (it will automatically load checkpoint during initialize)
     async def run():
@@ -177,6 +301,7 @@ def resume(state_file, config, output):
         crawl_config = CrawlConfig(seed_urls=seed_urls, **cfg)
 
         crawler = DeepHarvest(crawl_config)
+        _enable_eager_tasks()
 
         try:
             click.echo("Initializing crawler...")
@@ -200,7 +325,10 @@ def resume(state_file, config, output):
         finally:
             await crawler.shutdown()
 
-    asyncio.run(run())
+    try:
+        _run_async(run())
+    finally:
+        _stop_logging(log_setup)
 
     click.echo("Resume completed!")
 
@@ -228,7 +356,7 @@ def status(redis_url):
 
         await frontier.close()
 
-    asyncio.run(get_status())
+    _run_async(get_status())
 
 
 @cli.command()
@@ -3,19 +3,90 @@ Core Crawler Orchestrator
 """
 
 import asyncio
+import functools
+import json
 import logging
+import os
+import re
+import sys
 import time
-from typing import Optional, Dict, Any, List, Set
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from urllib.parse import urlparse, urljoin
 import aiohttp
 from playwright.async_api import async_playwright
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 from .site_rules import SiteRuleMatcher, HeuristicSiteDetector
+from .url_utils import normalize_url
+from ..utils.atomic import write_atomic
+from ..utils.bloom import BloomFilter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses make the hot stats counters cheaper to update (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Pool behind asyncio.to_thread, one per event loop and shared by every crawler
+# on it; closing the loop shuts its default executor down
+_CPU_POOLS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# Links to the same hosts/paths repeat constantly; parse each distinct URL once
+_urlparse = functools.lru_cache(maxsize=1 << 16)(urlparse)
+
+# JS framework markers, scanned once over the raw body prefix
+_JS_FRAMEWORK_RE = re.compile(rb"react|vue|angular|next\.js|nuxt|__NEXT_DATA__", re.I)
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+@functools.lru_cache(maxsize=4096)
+def _subdomain_scope(domain: str) -> Tuple[frozenset, str]:
+    """Parent domains of domain, and the suffix its subdomains end with"""
+    labels = domain.split(".")
+    parents = frozenset(".".join(labels[i:]) for i in range(1, len(labels)))
+    return parents, "." + domain
+
+
+def _is_near_empty(text: str, limit: int = 500) -> bool:
+    """Equivalent to len(text.strip()) < limit without copying the whole body"""
+    if len(text) < limit:
+        return True
+    first = _NON_SPACE_RE.search(text)
+    if first is None:
+        return True
+    tail = text[-limit:]
+    trailing = len(tail) - len(tail.rstrip())
+    if trailing == len(tail):
+        # Long whitespace run at the end; fall back to the exact check
+        return len(text.strip()) < limit
+    return len(text) - first.start() - trailing < limit
+
+
+def _write_checkpoint(path: Path, state: Dict[str, Any]):
+    """Serialize state and atomically replace path with it (blocking)"""
+    if orjson is not None:
+        data = orjson.dumps(state, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(state, separators=(",", ":")) + "\n").encode("utf-8")
+
+    write_atomic(path, data)
+
+
+def _read_checkpoint(path: Path) -> Dict[str, Any]:
+    """Read and parse a checkpoint written by _write_checkpoint (blocking)"""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class CrawlStrategy(Enum):
     BFS = "breadth_first"
@@ -23,7 +94,7 @@ class CrawlStrategy(Enum):
     PRIORITY = "priority"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CrawlConfig:
     """Comprehensive crawl configuration"""
 
@@ -59,6 +130,8 @@ class CrawlConfig:
     concurrent_requests: int = 10
     per_host_concurrent: int = 2
     request_delay_ms: int = 100
+    http2: bool = False  # Multiplexed HTTP/2 via httpx (needs the http2 extra)
+    request_timeout: int = 30  # Total seconds per request; stalled connects/reads abort sooner
 
     # Crawl limits
     max_urls: Optional[int] = None  # Maximum total URLs to crawl
@@ -69,6 +142,7 @@ class CrawlConfig:
     # Resumability
     checkpoint_interval: int = 100
     state_file: str = "crawl_state.json"
+    expected_urls: int = 10_000_000  # Sizes the visited-URL Bloom filter (1% error rate)
 
     # ML features
     enable_ml_extraction: bool = True
@@ -91,6 +165,9 @@ class DeepHarvest:
     Main crawler orchestrator coordinating all subsystems
     """
 
+    # Path fragments that get a priority boost
+    IMPORTANT_PATH_TOKENS = ("/about", "/contact", "/products", "/services")
+
     def __init__(self, config: CrawlConfig):
         self.config = config
         self.frontier = None
@@ -98,14 +175,24 @@ class DeepHarvest:
         self.browser_scraper = None
         self.extractors = {}
         self.ml_models = {}
+        self._storage = None  # Storage backend, created once in initialize()
         self.exporters = {}  # Dictionary of initialized exporters
-        self.visited: Set[str] = set()
+        self.visited: Union[Set[str], BloomFilter] = set()
         self.stats = CrawlStats()
         self.domain_page_counts: Dict[str, int] = {}  # Track pages per domain
         self.crawl_start_time: Optional[float] = None  # Track crawl start time
         self._stop_flag = asyncio.Event()  # Signal to stop all workers
         self._stats_lock = asyncio.Lock()  # Lock for thread-safe stats updates
         self._frontier_restored: bool = False  # Track if frontier was restored from checkpoint
+        self._local_q: Optional[asyncio.Queue] = None  # Batches pulled from the frontier
+        self._busy_workers = 0  # Workers currently processing a URL
+        # URLs taken from the frontier but not processed yet (buffered or in flight);
+        # checkpoints save them as pending, since they're already marked seen
+        self._claimed: Dict[str, Tuple[int, float]] = {}
+        self._cpu_pool: Optional[ThreadPoolExecutor] = None  # Runs parsing/ML off the loop
+        self._checkpoint_dir_ready = False  # Checkpoint parent dir created
+        self._checkpoint_lock = asyncio.Lock()  # One checkpoint write at a time
+        self._visited_generation = 0  # Saved visited filter the checkpoint builds on
 
         # Initialize site rule matcher
         self.site_rule_matcher = SiteRuleMatcher(config.site_rules)
@@ -115,16 +202,32 @@ class DeepHarvest:
         """Initialize all subsystems"""
         logger.info("Initializing DeepHarvest...")
 
+        # Shared pool behind asyncio.to_thread for CPU-bound extraction and ML;
+        # lxml releases the GIL while parsing, so allow some oversubscription
+        loop = asyncio.get_running_loop()
+        self._cpu_pool = _CPU_POOLS.get(loop)
+        if self._cpu_pool is None:
+            self._cpu_pool = _CPU_POOLS[loop] = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 2) * 2), thread_name_prefix="deepharvest-cpu"
+            )
+            loop.set_default_executor(self._cpu_pool)
+
         # Initialize frontier
         if self.config.distributed:
             from ..distributed.redis_frontier import RedisFrontier
 
-            self.frontier = RedisFrontier(self.config.redis_url)
+            self.frontier = RedisFrontier(
+                self.config.redis_url, max_connections=self.config.concurrent_requests + 1
+            )
             await self.frontier.connect()
+            await self.frontier.requeue_in_progress()  # Left by instances that died
         else:
             from .frontier import LocalFrontier
 
-            self.frontier = LocalFrontier(self.config.strategy)
+            # Local mode tracks seen URLs in a Bloom filter saved with checkpoints;
+            # the frontier consults it so each URL is only enqueued once
+            self.visited = self._open_visited_filter()
+            self.frontier = LocalFrontier(self.config.strategy, seen=self.visited)
 
         # Load checkpoint if resuming (must be after frontier initialization)
         await self._load_checkpoint()
@@ -133,29 +236,73 @@ class DeepHarvest:
         from .fetcher import AdvancedFetcher
 
         self.fetcher = AdvancedFetcher(self.config)
-        await self.fetcher.initialize()
 
         # Initialize browser scraper if enabled
         if self.config.enable_js:
             from ..browser import BrowserScraper
 
             self.browser_scraper = BrowserScraper(self.config)
-            await self.browser_scraper.initialize()
         else:
             self.browser_scraper = None
 
-        # Initialize extractors
-        await self._initialize_extractors()
-
-        # Initialize ML models if enabled
+        # The remaining subsystems are independent, so bring them up concurrently
+        startup = [
+            self.fetcher.initialize(),
+            self._initialize_extractors(),
+            self._initialize_exporters(),
+        ]
+        if self.browser_scraper:
+            startup.append(self.browser_scraper.initialize())
         if self.config.enable_ml_extraction:
-            await self._initialize_ml_models()
+            startup.append(self._initialize_ml_models())
+        tasks = [asyncio.ensure_future(coro) for coro in startup]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # gather leaves the other startups running when one fails; stop them
+            # and close the sessions and browser they opened, so nothing is left
+            # launching after the error (both closes are safe to repeat)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self.browser_scraper:
+                await self.browser_scraper.close()
+            await self.fetcher.close()
+            raise
+
+        # Initialize storage backend
+        from ..distributed.storage import create_storage_backend
 
-        # Initialize exporters
-        await self._initialize_exporters()
+        self._storage = create_storage_backend(self.config)
 
         logger.info("DeepHarvest initialized successfully")
 
+    def _visited_filter_path(self, generation: int) -> Path:
+        """Saved visited filters alternate between two files, by generation"""
+        return Path(self.config.state_file).with_suffix(f".bloom.{generation % 2}")
+
+    def _open_visited_filter(self) -> BloomFilter:
+        """
+        Create the visited filter. It's filled from the checkpoint, if any, by
+        _load_checkpoint; checkpoints save the URLs added since the last saved
+        copy of the filter and only rewrite the whole filter once those add up.
+        """
+        state_file = Path(self.config.state_file)
+        if not state_file.exists():
+            # Stale filters from an earlier, unrelated crawl
+            stale = [state_file.with_suffix(".bloom"), *map(self._visited_filter_path, (0, 1))]
+            for path in stale:
+                if path.exists():
+                    path.unlink()
+
+        # Every discovered URL is added, not just crawled ones, so a max_urls crawl
+        # still needs room for the links its pages turn up
+        capacity = self.config.expected_urls
+        if self.config.max_urls:
+            capacity = min(capacity, max(100_000, 100 * self.config.max_urls))
+
+        return BloomFilter(capacity=capacity, error_rate=0.01, track_changes=True)
+
     async def _initialize_extractors(self):
         """Initialize all content extractors"""
         from ..extractors.text import TextExtractor
@@ -164,6 +311,10 @@ class DeepHarvest:
         from ..extractors.media import MediaExtractor
         from ..extractors.ocr import OCRExtractor
         from ..extractors.structured import StructuredDataExtractor
+        from ..extractors.archive import ArchiveExtractor
+        from ..traps.detector import TrapDetector
+        from ..engines.api_detector import APIDetector
+        from .link_extractor import AdvancedLinkExtractor
 
         self.extractors["text"] = TextExtractor()
         self.extractors["pdf"] = PDFExtractor()
@@ -172,21 +323,28 @@ class DeepHarvest:
         self.extractors["ocr"] = OCRExtractor()
         self.extractors["structured"] = StructuredDataExtractor()
 
+        # Stateless helpers used on every URL
+        self._archive_extractor = ArchiveExtractor()
+        self._trap_detector = TrapDetector()
+        self._api_detector = APIDetector()
+        self._link_extractor = AdvancedLinkExtractor()
+
     async def _initialize_ml_models(self):
         """Initialize ML models for intelligent extraction"""
         from ..ml.page_classifier import PageClassifier
         from ..ml.soft404 import Soft404Detector
         from ..ml.quality import QualityScorer
         from ..ml.dedup import NearDuplicateDetector
+        from ..ml.boilerplate import BoilerplateRemover
 
         self.ml_models["classifier"] = PageClassifier()
         self.ml_models["soft404"] = Soft404Detector()
         self.ml_models["quality"] = QualityScorer()
         self.ml_models["dedup"] = NearDuplicateDetector()
+        self.ml_models["boilerplate"] = BoilerplateRemover()
 
         # Load pre-trained models
-        for model in self.ml_models.values():
-            await model.load()
+        await asyncio.gather(*(model.load() for model in self.ml_models.values()))
 
     async def _initialize_exporters(self):
         """Initialize configured exporters"""
@@ -208,20 +366,39 @@ class DeepHarvest:
         # Add seed URLs to frontier only if not resuming from checkpoint
         # If frontier was restored, it already contains pending URLs
         if not self._frontier_restored:
-            for url in self.config.seed_urls:
-                if not self._stop_flag.is_set():
-                    await self.frontier.add(url, depth=0, priority=1.0)
+            seeds = await self.frontier.add_many([(url, 0, 1.0) for url in self.config.seed_urls])
+            if self.config.distributed and len(seeds) < len(set(self.config.seed_urls)):
+                # The Redis seen set outlives a crawl, so an earlier one can skip seeds
+                logger.warning(
+                    f"{len(set(self.config.seed_urls)) - len(seeds)} seed URLs were already "
+                    "seen in this Redis frontier and were not queued; clear its deepharvest:* "
+                    "keys to crawl them again"
+                )
         else:
             logger.info("Skipping seed URLs - resuming from checkpoint with existing frontier")
 
+        # One pump task batch-fetches from the frontier; workers drain the local queue
+        num_workers = self._num_workers()
+        logger.debug(f"Using {num_workers} workers")
+        self._local_q = asyncio.Queue(maxsize=num_workers * 4)
+        pump = asyncio.create_task(self._frontier_pump(num_workers))
+
         # Create worker tasks
-        workers = [
-            asyncio.create_task(self._worker(i)) for i in range(self.config.concurrent_requests)
-        ]
+        workers = [asyncio.create_task(self._worker(i)) for i in range(num_workers)]
 
         # Wait for all workers to complete
         await asyncio.gather(*workers, return_exceptions=True)
 
+        # Workers may stop on a limit before the pump notices
+        pump.cancel()
+        await asyncio.gather(pump, return_exceptions=True)
+
+        # Hand back URLs that were buffered but never processed
+        while not self._local_q.empty():
+            item = self._local_q.get_nowait()
+            if item is not None:
+                await self._requeue(*item)
+
         # Stop frontier from accepting new URLs
         if hasattr(self.frontier, "stop"):
             self.frontier.stop()
@@ -229,6 +406,25 @@ class DeepHarvest:
         logger.info("Crawl completed")
         await self._generate_reports()
 
+    def _num_workers(self) -> int:
+        """
+        Number of worker tasks to run. When the crawl is confined to the seed
+        hosts, the connector's per-host limit caps in-flight fetches, so workers
+        beyond 2x that per host would only sit idle.
+
+        The cap only applies with follow_subdomains=False (and follow_external
+        off, on a fresh frontier). Subdomains are separate hosts with their own
+        per-host limit and aren't known until they're discovered, so with the
+        default follow_subdomains=True every crawl gets concurrent_requests.
+        """
+        limit = self.config.concurrent_requests
+        # Restored frontiers may hold URLs for hosts other than the seeds
+        if self.config.follow_external or self.config.follow_subdomains or self._frontier_restored:
+            return limit
+
+        hosts = {_urlparse(url).netloc for url in self.config.seed_urls}
+        return max(1, min(limit, 2 * self.config.per_host_concurrent * len(hosts)))
+
     async def _check_limits(self) -> bool:
         """Check if any limits have been reached. Returns True if should stop."""
         # Check stop flag first
@@ -255,51 +451,74 @@ class DeepHarvest:
 
         return False
 
-    async def _worker(self, worker_id: int):
-        """Worker coroutine for processing URLs"""
+    async def _frontier_pump(self, num_workers: int, batch_size: int = 32):
+        """Move URLs from the frontier into the local queue in batches"""
         consecutive_empty = 0
-        max_empty_checks = 10  # Exit after 10 consecutive empty checks (1 second total)
+        max_empty_checks = 10  # Give up after 10 consecutive empty batches while idle
+
+        while not self._stop_flag.is_set():
+            # Shielded: cancelling mid-call would drop URLs already popped from the
+            # frontier, and once seen add_many won't queue them again
+            fetch = asyncio.ensure_future(self.frontier.get_many(batch_size))
+            try:
+                items = await asyncio.shield(fetch)
+            except asyncio.CancelledError:
+                for url, depth, priority in await fetch:
+                    await self.frontier.add(url, depth, priority)
+                raise
+            if not items:
+                # Busy workers may still enqueue links, so only count idle checks
+                if self._local_q.empty() and self._busy_workers == 0:
+                    consecutive_empty += 1
+                    if consecutive_empty >= max_empty_checks:
+                        logger.debug(f"Frontier empty for {max_empty_checks} checks, stopping")
+                        break
+                await asyncio.sleep(0.1)
+                continue
 
+            consecutive_empty = 0
+            self._claimed.update((url, (depth, priority)) for url, depth, priority in items)
+            for i, item in enumerate(items):
+                try:
+                    await self._local_q.put(item)
+                except asyncio.CancelledError:
+                    # Don't lose the rest of the batch if the crawl is winding down
+                    for url, depth, priority in items[i:]:
+                        await self._requeue(url, depth, priority)
+                    raise
+
+        # One sentinel per worker
+        for _ in range(num_workers):
+            await self._local_q.put(None)
+
+    async def _worker(self, worker_id: int):
+        """Worker coroutine for processing URLs"""
         while True:
             # Check limits BEFORE getting URL from queue
             if await self._check_limits():
                 break
 
-            # Get next URL from frontier
-            item = await self.frontier.get()
+            # Get next URL from the local queue
+            item = await self._local_q.get()
             if item is None:
-                # If queue is empty and stop flag is set, we're done
-                if self._stop_flag.is_set():
-                    break
-                # Track consecutive empty checks
-                consecutive_empty += 1
-                if consecutive_empty >= max_empty_checks:
-                    # Queue has been empty for a while, likely done
-                    logger.debug(
-                        f"Worker {worker_id}: Queue empty for {max_empty_checks} checks, exiting"
-                    )
-                    break
-                # Otherwise, wait a bit and check again
-                await asyncio.sleep(0.1)
-                continue
-
-            # Reset empty counter when we get an item
-            consecutive_empty = 0
+                logger.debug(f"Worker {worker_id}: Frontier drained, exiting")
+                break
 
             url, depth, priority = item
 
             # Double-check limits after getting URL (in case another worker hit limit)
             if await self._check_limits():
                 # Put URL back in queue if we're stopping
-                await self.frontier.add(url, depth, priority)
+                await self._requeue(url, depth, priority)
                 break
 
             # Check limit right before processing (most critical check)
             async with self._stats_lock:
                 if self.config.max_urls and self.stats.processed >= self.config.max_urls:
-                    await self.frontier.add(url, depth, priority)
+                    await self._requeue(url, depth, priority)
                     break
 
+            self._busy_workers += 1
             try:
                 await self._process_url(url, depth)
             except KeyboardInterrupt:
@@ -314,28 +533,41 @@ class DeepHarvest:
                     logger.warning(f"Failed to save checkpoint after interruption: {e}")
                 break
             except Exception as e:
-                logger.error(f"Error processing {url}: {e}", exc_info=True)
+                # Tracebacks are costly and failures (timeouts, DNS) are routine
+                logger.warning(
+                    "Error processing %s: %r", url, e, exc_info=logger.isEnabledFor(logging.DEBUG)
+                )
                 async with self._stats_lock:
                     self.stats.errors += 1
                 # Continue processing other URLs even if one fails
             finally:
+                self._busy_workers -= 1
+                self._claimed.pop(url, None)
                 await self.frontier.mark_done(url)
                 async with self._stats_lock:
                     self.stats.processed += 1
                     processed = self.stats.processed
 
-                # Checkpoint periodically
-                if processed % self.config.checkpoint_interval == 0:
-                    await self._save_checkpoint()
+                # Checkpoint periodically; if a save is already running, the next
+                # interval picks up this progress
+                if (
+                    processed % self.config.checkpoint_interval == 0
+                    and not self._checkpoint_lock.locked()
+                ):
+                    try:
+                        await self._save_checkpoint()
+                    except Exception as e:
+                        logger.warning(f"Failed to save checkpoint: {e}")
+
+    async def _requeue(self, url: str, depth: int, priority: float):
+        """Hand a claimed but unprocessed URL back to the frontier"""
+        self._claimed.pop(url, None)
+        await self.frontier.add(url, depth, priority)
 
     async def _process_url(self, url: str, depth: int):
         """Process a single URL"""
         logger.info(f"Processing {url} (depth {depth})")
 
-        # Check if already visited (distributed-safe)
-        if await self._is_visited(url):
-            return
-
         # Check max pages per domain limit
         if self.config.max_pages_per_domain:
             parsed = urlparse(url)
@@ -386,6 +618,7 @@ class DeepHarvest:
         else:
             response = await self.fetcher.fetch(url)
             if response is None:
+                # Retries are exhausted; the URL stays seen, so it isn't queued again
                 return
 
         # Check max response size limit
@@ -422,8 +655,7 @@ class DeepHarvest:
             )
             # Also check if HTML is mostly empty (likely needs JS)
             if not needs_js and hasattr(response, "text"):
-                text_len = len(response.text.strip())
-                if text_len < 500:  # Very short HTML, likely needs JS
+                if _is_near_empty(response.text):  # Very short HTML, likely needs JS
                     needs_js = True
 
             if needs_js and self.browser_scraper:
@@ -465,11 +697,11 @@ class DeepHarvest:
 
         # Remove boilerplate if text extraction
         if "text" in content and self.config.enable_ml_extraction:
-            from ..ml.boilerplate import BoilerplateRemover
-
-            remover = BoilerplateRemover()
+            remover = self.ml_models["boilerplate"]
             if hasattr(response, "text"):
-                content["text"]["clean_text"] = remover.extract_main_content(response.text)
+                content["text"]["clean_text"] = await asyncio.to_thread(
+                    remover.extract_main_content, response.text
+                )
 
         # Extract structured data
         structured_data = await self.extractors["structured"].extract(response)
@@ -489,17 +721,17 @@ class DeepHarvest:
         ):
             new_urls = await self._extract_urls(url, response)
             logger.info(f"Found {len(new_urls)} links from {url}")
-            added_count = 0
-            for new_url in new_urls:
-                # Check limits before adding each URL
-                if await self._check_limits():
-                    break
-                if self._should_follow(url, new_url):
-                    priority = await self._calculate_priority(new_url)
-                    await self.frontier.add(new_url, depth + 1, priority)
-                    added_count += 1
-            if added_count > 0:
-                logger.info(f"Added {added_count} URLs to crawl queue")
+            # Check limits once, then enqueue the whole page's links in one call
+            if not await self._check_limits():
+                follow = [new_url for new_url in new_urls if self._should_follow(url, new_url)]
+                batch = [
+                    (new_url, depth + 1, await self._calculate_priority(new_url))
+                    for new_url in follow
+                ]
+                # The frontier drops URLs that were already seen
+                added = await self.frontier.add_many(batch) if batch else []
+                if added:
+                    logger.info(f"Added {len(added)} URLs to crawl queue")
 
         async with self._stats_lock:
             self.stats.success += 1
@@ -530,30 +762,17 @@ class DeepHarvest:
         elif "audio/" in content_type:
             result["audio"] = await self.extractors["media"].extract_audio(response)
         elif "application/zip" in content_type or url.endswith(".zip"):
-            from ..extractors.archive import ArchiveExtractor
-
-            extractor = ArchiveExtractor()
-            result["archive"] = await extractor.extract_zip(response.content)
+            result["archive"] = await self._archive_extractor.extract_zip(response.content)
         elif "application/x-tar" in content_type or url.endswith((".tar", ".tar.gz")):
-            from ..extractors.archive import ArchiveExtractor
-
-            extractor = ArchiveExtractor()
-            result["archive"] = await extractor.extract_tar(response.content)
+            result["archive"] = await self._archive_extractor.extract_tar(response.content)
         elif "application/epub+zip" in content_type or url.endswith(".epub"):
-            from ..extractors.archive import ArchiveExtractor
-
-            extractor = ArchiveExtractor()
-            result["archive"] = await extractor.extract_epub(response.content)
+            result["archive"] = await self._archive_extractor.extract_epub(response.content)
 
         return result
 
     async def _extract_urls(self, base_url: str, response) -> List[str]:
         """Extract all URLs from response"""
-        from .link_extractor import AdvancedLinkExtractor
-        from ..engines.api_detector import APIDetector
-
-        extractor = AdvancedLinkExtractor()
-        urls = await extractor.extract(response, base_url)
+        urls = await self._link_extractor.extract(response, base_url)
 
         # Check if link extraction might have failed (heuristic detection)
         if self.heuristic_detector.detect_link_extraction_issue(response, len(urls)):
@@ -564,37 +783,30 @@ class DeepHarvest:
 
         # Also detect API endpoints if HTML
         if hasattr(response, "text") and response.text:
-            api_detector = APIDetector()
-            api_urls = api_detector.detect_api_endpoints(response.text, base_url)
+            api_urls = self._api_detector.detect_api_endpoints(response.text, base_url)
             urls.extend(api_urls)
 
-        # Normalize and deduplicate
-        from .url_utils import normalize_url, deduplicate_urls
-
-        normalized = [normalize_url(url) for url in urls]
-        deduplicated = await deduplicate_urls(normalized)
-
-        return deduplicated
+        # Normalize and deduplicate within the page in one ordered pass;
+        # cross-page repeats are caught by the visited filter
+        return list(dict.fromkeys(normalize_url(url) for url in urls))
 
     def _should_follow(self, current_url: str, target_url: str) -> bool:
         """Determine if a URL should be followed"""
-        current_domain = urlparse(current_url).netloc
-        target_domain = urlparse(target_url).netloc
+        # External - always follow
+        if self.config.follow_external:
+            return True
+
+        current_domain = _urlparse(current_url).netloc
+        target_domain = _urlparse(target_url).netloc
 
         # Same domain - always follow
         if current_domain == target_domain:
             return True
 
-        # Subdomain
+        # Subdomain (either direction), via a per-domain precomputed scope
         if self.config.follow_subdomains:
-            if target_domain.endswith("." + current_domain) or current_domain.endswith(
-                "." + target_domain
-            ):
-                return True
-
-        # External
-        if self.config.follow_external:
-            return True
+            parents, suffix = _subdomain_scope(current_domain)
+            return target_domain in parents or target_domain.endswith(suffix)
 
         return False
 
@@ -604,8 +816,8 @@ class DeepHarvest:
         priority = 0.5
 
         # Boost for common important pages
-        path = urlparse(url).path.lower()
-        if any(imp in path for imp in ["/about", "/contact", "/products", "/services"]):
+        path = _urlparse(url).path.lower()
+        if any(imp in path for imp in self.IMPORTANT_PATH_TOKENS):
             priority += 0.2
 
         # ML-based priority if available
@@ -617,10 +829,7 @@ class DeepHarvest:
 
     async def _is_trap(self, url: str, response) -> bool:
         """Detect if URL is a trap"""
-        from ..traps.detector import TrapDetector
-
-        detector = TrapDetector()
-        return await detector.is_trap(url, response)
+        return await self._trap_detector.is_trap(url, response)
 
     async def _is_soft_404(self, response) -> bool:
         """Detect soft 404 pages"""
@@ -634,15 +843,8 @@ class DeepHarvest:
         # Check for common JS frameworks
         if not hasattr(response, "text"):
             return False
-        content = response.text[:10000].lower()
-        js_indicators = ["react", "vue", "angular", "next.js", "nuxt", "__NEXT_DATA__"]
-        return any(indicator in content for indicator in js_indicators)
-
-    async def _is_visited(self, url: str) -> bool:
-        """Check if URL has been visited"""
-        if self.config.distributed:
-            return await self.frontier.is_visited(url)
-        return url in self.visited
+        raw = getattr(response, "content", None) or response.text[:10000].encode("utf-8", "ignore")
+        return _JS_FRAMEWORK_RE.search(raw, 0, 10000) is not None
 
     async def _mark_visited(self, url: str):
         """Mark URL as visited"""
@@ -653,10 +855,7 @@ class DeepHarvest:
 
     async def _store_result(self, url: str, content: Dict, structured_data: Dict, response):
         """Store crawl results"""
-        from ..distributed.storage import create_storage_backend
-
-        storage = create_storage_backend(self.config)
-        await storage.store(url, content, structured_data, response)
+        await self._storage.store(url, content, structured_data, response)
 
         # Export to configured exporters
         await self._export_result(url, content, structured_data, response)
@@ -689,40 +888,84 @@ class DeepHarvest:
 
     async def _save_checkpoint(self):
         """Save crawl state for resumability"""
-        import json
-        from pathlib import Path
         from .frontier import LocalFrontier
 
-        state = {
-            "processed": self.stats.processed,
-            "success": self.stats.success,
-            "errors": self.stats.errors,
-            "visited": list(self.visited) if not self.config.distributed else [],
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        # Save frontier state (local mode only)
-        if not self.config.distributed and isinstance(self.frontier, LocalFrontier):
-            try:
-                frontier_pending = await self.frontier.get_pending_snapshot()
-                if frontier_pending:
-                    state["frontier"] = frontier_pending
-                    logger.debug(f"Saving {len(frontier_pending)} pending URLs to checkpoint")
-            except Exception as e:
-                logger.warning(f"Failed to save frontier state: {e}")
-
-        state_file = Path(self.config.state_file)
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
-
-        logger.info(f"Checkpoint saved to {state_file}")
+        # Checkpoints run in a thread, so serialize them: each one replaces the
+        # state file with a snapshot at least as new as the previous one
+        async with self._checkpoint_lock:
+            state = {
+                "processed": self.stats.processed,
+                "success": self.stats.success,
+                "errors": self.stats.errors,
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+
+            # Visited URLs (local mode only). For the Bloom filter, only the URLs
+            # added since the last saved copy of it (visited_base)
+            if not self.config.distributed:
+                if isinstance(self.visited, BloomFilter):
+                    state["visited"] = list(self.visited.changes)
+                    state["visited_base"] = self._visited_generation
+                else:
+                    state["visited"] = list(self.visited)
+                state["visited_count"] = len(self.visited)
+
+            # Save frontier state (local mode only)
+            if not self.config.distributed and isinstance(self.frontier, LocalFrontier):
+                try:
+                    frontier_pending = await self.frontier.get_pending_snapshot()
+                    frontier_pending.extend(
+                        {"url": url, "depth": depth, "priority": priority}
+                        for url, (depth, priority) in self._claimed.items()
+                    )
+                    if frontier_pending:
+                        state["frontier"] = frontier_pending
+                        logger.debug(f"Saving {len(frontier_pending)} pending URLs to checkpoint")
+                except Exception as e:
+                    logger.warning(f"Failed to save frontier state: {e}")
+
+            state_file = Path(self.config.state_file)
+            if not self._checkpoint_dir_ready:
+                state_file.parent.mkdir(parents=True, exist_ok=True)
+                self._checkpoint_dir_ready = True
+
+            # Encoding and fsync happen off the loop so workers keep running
+            await asyncio.to_thread(_write_checkpoint, state_file, state)
+
+            # Once the change list outweighs a fraction of the filter, save the
+            # whole filter as the next generation; later checkpoints then list
+            # only what's added after it
+            if (
+                isinstance(self.visited, BloomFilter)
+                and not self.config.distributed
+                and len(self.visited.changes) >= max(1000, self.visited.num_bits // 2048)
+            ):
+                await self._save_visited_filter()
+
+            logger.info(f"Checkpoint saved to {state_file}")
+
+    async def _save_visited_filter(self):
+        """
+        Write the visited filter as the next generation, to the file the state
+        file doesn't reference. A crash before the next checkpoint leaves the
+        referenced generation in place, so the filter on disk is never ahead of
+        the frontier saved with it.
+        """
+        generation = self._visited_generation + 1
+        changes = self.visited.changes
+
+        def write() -> int:
+            saved = len(changes)  # Everything before this is in the snapshot
+            data = self.visited.snapshot(generation)
+            self.visited.write_snapshot(data, self._visited_filter_path(generation))
+            return saved
+
+        saved = await asyncio.to_thread(write)
+        del changes[:saved]
+        self._visited_generation = generation
 
     async def _load_checkpoint(self):
         """Load previous crawl state"""
-        import json
-        from pathlib import Path
         from .frontier import LocalFrontier
 
         state_file = Path(self.config.state_file)
@@ -731,15 +974,25 @@ class DeepHarvest:
             return
 
         try:
-            with open(state_file, "r") as f:
-                state = json.load(f)
+            state = _read_checkpoint(state_file)
 
             self.stats.processed = state.get("processed", 0)
             self.stats.success = state.get("success", 0)
             self.stats.errors = state.get("errors", 0)
 
             if not self.config.distributed:
-                self.visited = set(state.get("visited", []))
+                base = state.get("visited_base", 0)
+                if base and isinstance(self.visited, BloomFilter):
+                    if self.visited.load(self._visited_filter_path(base), generation=base):
+                        self._visited_generation = base
+                    else:
+                        logger.warning(
+                            "Saved visited filter is missing or doesn't match the checkpoint; "
+                            "already-crawled URLs may be crawled again"
+                        )
+                # URLs added since the saved filter (or all of them, for a set or
+                # older checkpoints)
+                self.visited.update(state.get("visited", []))
 
             # Restore frontier state (local mode only, after frontier is initialized)
             if not self.config.distributed and isinstance(self.frontier, LocalFrontier):
@@ -786,6 +1039,9 @@ class DeepHarvest:
         if self.fetcher:
             await self.fetcher.close()
 
+        if self._storage:
+            await self._storage.close()
+
         # Close exporters
         for exporter_name, exporter in self.exporters.items():
             try:
@@ -798,7 +1054,7 @@ class DeepHarvest:
         logger.info("Shutdown complete")
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CrawlStats:
     """Crawl statistics"""
 
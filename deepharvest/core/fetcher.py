@@ -2,14 +2,84 @@
 fetcher.py - Advanced HTTP Client
 """
 
+import asyncio
 import logging
+import weakref
 import aiohttp
-from typing import Optional
+from typing import Dict, Optional
+from urllib.parse import urlparse
 from .crawler import CrawlConfig
 from ..utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Sessions shared by fetchers with the same settings on the same event loop, so
+# keep-alive connections and the DNS cache outlive any single fetcher.
+# loop -> {settings key: [session, reference count]}
+_SESSION_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _decode_body(content: bytes, charset: Optional[str], url: str) -> str:
+    """Decode a body using the declared charset, falling back to detection"""
+    try:
+        return content.decode(charset or "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        pass
+
+    # Declared (or default) charset failed, try encoding detection
+    try:
+        try:
+            import chardet
+
+            encoding = chardet.detect(content).get("encoding")
+            return content.decode(encoding or "utf-8", errors="replace")
+        except ImportError:
+            pass
+
+        # If chardet not available, try charset_normalizer
+        try:
+            from charset_normalizer import detect
+
+            encoding = (detect(content) or {}).get("encoding")
+            return content.decode(encoding or "utf-8", errors="replace")
+        except ImportError:
+            pass
+
+        # Last resort: latin-1 maps every byte
+        return content.decode("latin-1")
+    except Exception as decode_error:
+        logger.warning(
+            f"Encoding detection failed for {url}: {decode_error}, using utf-8 with replace"
+        )
+
+    return content.decode("utf-8", errors="replace")
+
+
+class FetchResponse:
+    """
+    Fetched response exposing status_code, headers, url, content and text.
+    The body is read once; text is decoded from it on first access, so binary
+    documents that are never read as text are never decoded.
+    """
+
+    def __init__(self, status_code: int, headers, url: str, content: bytes, charset=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self._content = content
+        self._charset = charset
+        self._text = None
+
+    @property
+    def content(self):
+        return self._content
+
+    @property
+    def text(self):
+        if self._text is None and self._content is not None:
+            self._text = _decode_body(self._content, self._charset, self.url)
+        return self._text
+
 
 class AdvancedFetcher:
     """HTTP/2, HTTP/3 capable fetcher with connection pooling"""
@@ -18,10 +88,70 @@ class AdvancedFetcher:
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
         self.connector = None
+        self.http2_client = None  # httpx.AsyncClient when config.http2 is enabled
+        # httpx has no per-host limit, so HTTP/2 requests take a slot per host
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._session_key = None
         self.site_rule_matcher = site_rule_matcher
 
+    def _default_headers(self) -> dict:
+        """Session-wide request headers"""
+        headers = {
+            "User-Agent": getattr(self.config, "user_agent", "DeepHarvest/1.0"),
+            "Accept": "text/html,application/xhtml+xml,application/xml,*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+
+        # Apply custom headers from config if available
+        if hasattr(self.config, "headers") and self.config.headers:
+            headers.update(self.config.headers)
+        return headers
+
+    def _initialize_http2(self) -> bool:
+        """Create a multiplexing HTTP/2 client. Returns False if httpx[http2] is missing."""
+        try:
+            import h2  # noqa: F401  (httpx needs it for http2=True)
+            import httpx
+        except ImportError:
+            logger.warning(
+                "http2 is enabled but httpx[http2] is not installed, using HTTP/1.1 "
+                "(pip install 'deepharvest[http2]')"
+            )
+            return False
+
+        self.http2_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.config.concurrent_requests,
+                max_keepalive_connections=self.config.per_host_concurrent,
+            ),
+            timeout=httpx.Timeout(self.config.request_timeout, connect=5.0, read=10.0),
+            headers=self._default_headers(),
+            follow_redirects=True,
+            verify=False,  # Matches the aiohttp connector's ssl=False
+        )
+        logger.info("Using HTTP/2 client")
+        return True
+
     async def initialize(self):
         """Initialize HTTP session with HTTP/2 support"""
+        if self.config.http2 and self._initialize_http2():
+            return
+
+        headers = self._default_headers()
+        key = (
+            self.config.concurrent_requests,
+            self.config.per_host_concurrent,
+            self.config.request_timeout,
+            tuple(sorted(headers.items())),
+        )
+        sessions = _SESSION_CACHE.setdefault(asyncio.get_running_loop(), {})
+        entry = sessions.get(key)
+        if entry and not entry[0].closed:
+            entry[1] += 1
+            self.session, self._session_key = entry[0], key
+            return
+
         import sys
         import aiohttp
         from aiohttp import ClientSession, TCPConnector
@@ -41,20 +171,16 @@ class AdvancedFetcher:
                 limit_per_host=self.config.per_host_concurrent,
                 ssl=False,  # Can be configured
                 resolver=resolver,  # Use Windows-compatible resolver
+                ttl_dns_cache=300,  # Crawls hit the same hosts for a long time
+                # Reclaim half-closed TLS transports on Pythons that leak them
+                enable_cleanup_closed=getattr(aiohttp.connector, "NEEDS_CLEANUP_CLOSED", True),
             )
 
-            timeout = aiohttp.ClientTimeout(total=30)
-
-            # Default headers
-            headers = {
-                "User-Agent": getattr(self.config, "user_agent", "DeepHarvest/1.0"),
-                "Accept": "text/html,application/xhtml+xml,application/xml,*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-
-            # Apply custom headers from config if available
-            if hasattr(self.config, "headers") and self.config.headers:
-                headers.update(self.config.headers)
+            # A stalled connect or read fails fast instead of holding a slot
+            # for the whole request budget
+            timeout = aiohttp.ClientTimeout(
+                total=self.config.request_timeout, connect=5, sock_connect=5, sock_read=10
+            )
 
             self.session = ClientSession(connector=connector, timeout=timeout, headers=headers)
         except Exception as e:
@@ -67,9 +193,12 @@ class AdvancedFetcher:
                 # Last resort: use default resolver
                 self.session = ClientSession()
 
+        sessions[key] = [self.session, 1]
+        self._session_key = key
+
     async def fetch(self, url: str, retries: int = 3):
         """Fetch URL with retries, compression, and error handling"""
-        if not self.session:
+        if not self.session and not self.http2_client:
             await self.initialize()
 
         # Get custom headers for this URL from site rules
@@ -82,7 +211,33 @@ class AdvancedFetcher:
             if custom_site_headers:
                 custom_headers.update(custom_site_headers)
 
+        async def _fetch_http2():
+            # One connection per host carries many concurrent streams, capped at
+            # per_host_concurrent like the aiohttp connector's limit_per_host
+            host = urlparse(url).netloc
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = self._host_slots[host] = asyncio.Semaphore(
+                    self.config.per_host_concurrent
+                )
+            async with slots:
+                response = await self.http2_client.get(url, headers=custom_headers)
+            return FetchResponse(
+                response.status_code,
+                response.headers,
+                str(response.url),
+                response.content,
+                response.charset_encoding,
+            )
+
         async def _fetch():
+            if self.http2_client:
+                try:
+                    return await _fetch_http2()
+                except Exception as e:
+                    logger.error(f"Error fetching {url}: {e}")
+                    raise
+
             try:
                 # Merge custom headers with session headers
                 request_headers = dict(self.session.headers)
@@ -91,81 +246,13 @@ class AdvancedFetcher:
                 async with self.session.get(
                     url, allow_redirects=True, headers=request_headers
                 ) as response:
-                    # Create response-like object
-                    class Response:
-                        def __init__(self, resp):
-                            self.status_code = resp.status
-                            self.headers = resp.headers
-                            self.url = str(resp.url)
-                            self._content = None
-                            self._text = None
-
-                        @property
-                        def content(self):
-                            return self._content
-
-                        @property
-                        def text(self):
-                            return self._text
-
-                    resp_obj = Response(response)
-                    resp_obj._content = await response.read()
-
-                    # Try to decode text with proper encoding detection
-                    try:
-                        # First try aiohttp's built-in text() which uses charset from headers
-                        resp_obj._text = await response.text()
-                    except (UnicodeDecodeError, LookupError) as e:
-                        # If that fails, try encoding detection
-                        try:
-                            import chardet
-
-                            detected = chardet.detect(resp_obj._content)
-                            encoding = detected.get("encoding", "utf-8")
-                            if encoding:
-                                resp_obj._text = resp_obj._content.decode(
-                                    encoding, errors="replace"
-                                )
-                            else:
-                                # Fallback to utf-8 with error replacement
-                                resp_obj._text = resp_obj._content.decode("utf-8", errors="replace")
-                        except ImportError:
-                            # If chardet not available, try charset_normalizer
-                            try:
-                                from charset_normalizer import detect
-
-                                detected = detect(resp_obj._content)
-                                if detected and len(detected) > 0:
-                                    encoding = detected[0].encoding
-                                    resp_obj._text = resp_obj._content.decode(
-                                        encoding, errors="replace"
-                                    )
-                                else:
-                                    resp_obj._text = resp_obj._content.decode(
-                                        "utf-8", errors="replace"
-                                    )
-                            except ImportError:
-                                # Last resort: try common encodings
-                                for enc in ["utf-8", "latin-1", "iso-8859-1", "cp1252"]:
-                                    try:
-                                        resp_obj._text = resp_obj._content.decode(
-                                            enc, errors="strict"
-                                        )
-                                        break
-                                    except (UnicodeDecodeError, LookupError):
-                                        continue
-                                else:
-                                    # If all fail, use replace mode
-                                    resp_obj._text = resp_obj._content.decode(
-                                        "utf-8", errors="replace"
-                                    )
-                        except Exception as decode_error:
-                            logger.warning(
-                                f"Encoding detection failed for {url}: {decode_error}, using utf-8 with replace"
-                            )
-                            resp_obj._text = resp_obj._content.decode("utf-8", errors="replace")
-
-                    return resp_obj
+                    return FetchResponse(
+                        response.status,
+                        response.headers,
+                        str(response.url),
+                        await response.read(),
+                        response.charset,
+                    )
 
             except aiohttp.ClientError as e:
                 logger.error(f"Network error fetching {url}: {e}")
@@ -184,5 +271,17 @@ class AdvancedFetcher:
     async def close(self):
         """Close session"""
         if self.session:
-            await self.session.close()
+            # Only the last fetcher using a shared session closes it
+            sessions = _SESSION_CACHE.get(asyncio.get_running_loop(), {})
+            entry = sessions.get(self._session_key)
+            if entry and entry[0] is self.session:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del sessions[self._session_key]
+                    await self.session.close()
+            else:
+                await self.session.close()
             self.session = None
+        if self.http2_client:
+            await self.http2_client.aclose()
+            self.http2_client = None
@@ -3,39 +3,238 @@ frontier.py - URL Frontier Management
 """
 
 import asyncio
-from typing import Optional, Tuple, List, Dict, Any
+import heapq
+import itertools
+import struct
+from typing import Optional, Tuple, List, Dict, Any, Set
 from .crawler import CrawlStrategy
+from ..utils.bloom import BloomFilter
+
+# Queued entries are one bytes object (depth, priority, then the UTF-8 URL):
+# one object per URL instead of a tuple plus a str (~3x the size).
+_RECORD = struct.Struct(">Id")
+
+
+def _pack(url: str, depth: int, priority: float) -> bytes:
+    return _RECORD.pack(depth, priority) + url.encode("utf-8")
+
+
+def _unpack(record: bytes) -> Tuple[str, int, float]:
+    depth, priority = _RECORD.unpack_from(record)
+    return record[_RECORD.size :].decode("utf-8"), depth, priority
+
+
+class _RingBuffer:
+    """
+    Growable power-of-two ring buffer with head/tail cursors.
+
+    Pops from either end are O(1) index arithmetic on a preallocated list,
+    with no per-item node allocation; capacity doubles when full.
+    """
+
+    __slots__ = ("_buf", "_mask", "_head", "_tail")
+
+    def __init__(self, capacity: int = 1024):
+        capacity = 1 << max(capacity - 1, 1).bit_length()
+        self._buf: List[Any] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def __iter__(self):
+        """Iterate items from head to tail without consuming them"""
+        if self._tail == self._head:
+            return iter(())
+        buf = self._buf
+        head = self._head & self._mask
+        tail = self._tail & self._mask
+        if head < tail:
+            return iter(buf[head:tail])
+        return itertools.chain(buf[head:], buf[:tail])
+
+    def append(self, item):
+        if self._tail - self._head > self._mask:
+            self._grow()
+        self._buf[self._tail & self._mask] = item
+        self._tail += 1
+
+    def extend(self, items):
+        """Append many items, growing at most once and copying by slices"""
+        items = list(items)
+        if len(self) + len(items) > len(self._buf):
+            self._grow(len(self) + len(items))
+        buf = self._buf
+        start = self._tail & self._mask
+        end = start + len(items)
+        if end <= len(buf):
+            buf[start:end] = items
+        else:
+            split = len(buf) - start
+            buf[start:] = items[:split]
+            buf[: end - len(buf)] = items[split:]
+        self._tail += len(items)
+
+    def popleft(self):
+        idx = self._head & self._mask
+        item = self._buf[idx]
+        self._buf[idx] = None  # Don't keep popped items alive
+        self._head += 1
+        return item
+
+    def pop(self):
+        self._tail -= 1
+        idx = self._tail & self._mask
+        item = self._buf[idx]
+        self._buf[idx] = None
+        return item
+
+    def _grow(self, min_capacity: int = 0):
+        items = list(self)
+        capacity = len(self._buf) * 2
+        while capacity < min_capacity:
+            capacity *= 2
+        self._buf = items + [None] * (capacity - len(items))
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = len(items)
+
+
+# Heap entries are a record behind a key that sorts bytewise: inverted
+# order-preserving priority bits, then depth, then insertion counter. One bytes
+# object per entry; a (priority, depth, counter, record) tuple costs ~130 more.
+_HEAP_KEY = struct.Struct(">QIQ")
+_SIGN = 1 << 63
+_MASK64 = (1 << 64) - 1
+_DOUBLE = struct.Struct(">d")
+_UINT64 = struct.Struct(">Q")
+
+
+def _priority_key(priority: float) -> int:
+    """Map priority to a uint64 that sorts descending by priority"""
+    (bits,) = _UINT64.unpack(_DOUBLE.pack(priority + 0.0))  # -0.0 -> 0.0
+    ordered = bits ^ _MASK64 if bits & _SIGN else bits | _SIGN
+    return ordered ^ _MASK64
+
+
+class _PriorityHeap:
+    """
+    Binary heap of packed records, highest priority first; ties go to the
+    shallower URL, then to the one added first.
+    """
+
+    __slots__ = ("_heap", "_counter")
+
+    def __init__(self):
+        self._heap: List[bytes] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        """Iterate records in heap (not priority) order"""
+        return (entry[_HEAP_KEY.size :] for entry in self._heap)
+
+    def _entry(self, record: bytes) -> bytes:
+        depth, priority = _RECORD.unpack_from(record)
+        return _HEAP_KEY.pack(_priority_key(priority), depth, next(self._counter)) + record
+
+    def append(self, record: bytes):
+        heapq.heappush(self._heap, self._entry(record))
+
+    def extend(self, records):
+        """Add many records with one O(n) heapify instead of n pushes"""
+        self._heap.extend(map(self._entry, records))
+        heapq.heapify(self._heap)
+
+    def pop(self) -> bytes:
+        return heapq.heappop(self._heap)[_HEAP_KEY.size :]
 
 
 class LocalFrontier:
     """Local in-memory frontier with BFS/DFS/Priority support"""
 
-    def __init__(self, strategy: CrawlStrategy):
+    def __init__(self, strategy: CrawlStrategy, seen: Optional[Set[str]] = None):
         self.strategy = strategy
-        self.queue = asyncio.Queue() if strategy == CrawlStrategy.BFS else asyncio.LifoQueue()
+        # URLs ever accepted by add_many or restored (any set-like); by default a
+        # Bloom filter, ~2.4 bytes per URL instead of a str in a set
+        self.seen = seen if seen is not None else BloomFilter(capacity=1_000_000, error_rate=1e-4)
+        if strategy == CrawlStrategy.PRIORITY:
+            self._items = _PriorityHeap()
+            self._pop = self._items.pop
+        else:
+            # BFS takes from the head (FIFO), DFS from the tail (LIFO)
+            self._items = _RingBuffer()
+            self._pop = self._items.popleft if strategy == CrawlStrategy.BFS else self._items.pop
+        self._not_empty = asyncio.Event()
         self._stopped = False  # Flag to stop accepting new URLs
 
     async def add(self, url: str, depth: int, priority: float):
         """Add URL to queue if not stopped"""
         if not self._stopped:
-            await self.queue.put((url, depth, priority))
+            self._items.append(_pack(url, depth, priority))
+            self._not_empty.set()
 
-    async def get(self):
-        """Get next URL from queue"""
-        if self._stopped and self.queue.empty():
-            return None
-        try:
-            return await asyncio.wait_for(self.queue.get(), timeout=1.0)
-        except asyncio.TimeoutError:
-            return None
+    async def add_many(self, items: List[Tuple[str, int, float]]) -> List[Tuple[str, int, float]]:
+        """
+        Add (url, depth, priority) items not seen before. Returns the items added.
+        A URL stays seen even if fetching it fails, so rediscovering it later
+        doesn't retry it; the fetcher's own retries are the only retries.
+        """
+        if self._stopped:
+            return []
+        seen = self.seen
+        added = []
+        for item in items:
+            if item[0] not in seen:
+                seen.add(item[0])
+                self._items.append(_pack(*item))
+                added.append(item)
+        if added:
+            self._not_empty.set()
+        return added
+
+    async def get(self, timeout: Optional[float] = 1.0):
+        """
+        Get next URL from queue, waiting up to timeout seconds (None waits
+        until a URL is added or the frontier is stopped) if it's empty
+        """
+        if not self._items:
+            if self._stopped:
+                return None
+            self._not_empty.clear()
+            try:
+                # add_many/add and stop() all set the event, so waiters wake at once
+                await asyncio.wait_for(self._not_empty.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+            if not self._items:  # Stopped, or another consumer took it first
+                return None
+        return _unpack(self._pop())
+
+    async def get_many(
+        self, count: int, timeout: Optional[float] = 1.0
+    ) -> List[Tuple[str, int, float]]:
+        """Get up to count URLs, waiting for the first one like get()"""
+        first = await self.get(timeout=timeout)
+        if first is None:
+            return []
+
+        items = [first]
+        while len(items) < count and self._items:
+            items.append(_unpack(self._pop()))
+        return items
 
     async def mark_done(self, url: str):
         """Mark URL as processed"""
-        self.queue.task_done()
 
     def stop(self):
-        """Stop accepting new URLs"""
+        """Stop accepting new URLs and wake any waiting get()"""
         self._stopped = True
+        self._not_empty.set()
 
     def is_stopped(self) -> bool:
         """Check if frontier is stopped"""
@@ -44,22 +243,12 @@ class LocalFrontier:
     async def get_pending_snapshot(self) -> List[Dict[str, Any]]:
         """
         Get a snapshot of all pending URLs in the queue.
-        This temporarily drains the queue, saves items, and restores them.
-        Safe to call during checkpoint save (not during active crawling).
+        Reads the buffer in place, so the queue is left untouched.
         """
         pending = []
-        # Drain queue
-        while not self.queue.empty():
-            try:
-                item = self.queue.get_nowait()
-                pending.append({"url": item[0], "depth": item[1], "priority": item[2]})
-            except asyncio.QueueEmpty:
-                break
-
-        # Restore items back to queue
-        for item in pending:
-            await self.queue.put((item["url"], item["depth"], item["priority"]))
-
+        for record in self._items:
+            url, depth, priority = _unpack(record)
+            pending.append({"url": url, "depth": depth, "priority": priority})
         return pending
 
     async def restore_pending(self, pending_items: List[Dict[str, Any]]):
@@ -67,5 +256,15 @@ class LocalFrontier:
         Restore pending URLs to the queue.
         Safe to call during checkpoint load (before crawl starts).
         """
+        # One synchronous burst, sized up front; the buffer is unbounded so
+        # nothing needs to await. Restored URLs are marked seen (checkpoints from
+        # before enqueue-time dedup only recorded processed URLs), so links found
+        # later aren't queued a second time.
+        seen = self.seen
+        records = []
         for item in pending_items:
-            await self.queue.put((item["url"], item["depth"], item["priority"]))
+            seen.add(item["url"])
+            records.append(_pack(item["url"], item["depth"], item["priority"]))
+        self._items.extend(records)
+        if pending_items:
+            self._not_empty.set()
@@ -2,6 +2,7 @@
 link_extractor.py - Advanced link extraction
 """
 
+import asyncio
 import logging
 import re
 from typing import List
@@ -15,7 +16,11 @@ class AdvancedLinkExtractor:
     """Extract links from HTML with various strategies"""
 
     async def extract(self, response, base_url: str) -> List[str]:
-        """Extract all links from response"""
+        """Extract all links from response (parsing runs in a worker thread)"""
+        return await asyncio.to_thread(self.extract_sync, response, base_url)
+
+    def extract_sync(self, response, base_url: str) -> List[str]:
+        """Extract all links from response, blocking the calling thread"""
         urls = []
 
         if hasattr(response, "text") and response.text:
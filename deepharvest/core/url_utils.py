@@ -4,6 +4,7 @@ url_utils.py - URL normalization & dedup
 
 import re
 import hashlib
+import functools
 from typing import List, Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin
 from bs4 import BeautifulSoup
@@ -124,8 +125,9 @@ class URLNormalizer:
         return hashlib.sha256(normalized.encode()).hexdigest()
 
 
+@functools.lru_cache(maxsize=1 << 17)
 def normalize_url(url: str) -> str:
-    """Normalize a URL"""
+    """Normalize a URL (memoized; sitewide nav and footer links repeat on every page)"""
     return URLNormalizer.normalize(url)
 
 
@@ -37,9 +37,18 @@ class DistributedCoordinator:
     async def start_crawl(self, seed_urls: List[str]):
         """Start distributed crawl"""
 
+        # URLs claimed by workers of a crawl that died would otherwise never be crawled
+        await self.frontier.requeue_in_progress()
+
         # Add seed URLs to frontier
-        for url in seed_urls:
-            await self.frontier.add(url, depth=0, priority=1.0)
+        added = await self.frontier.add_many([(url, 0, 1.0) for url in seed_urls])
+        if len(added) < len(set(seed_urls)):
+            # The seen set outlives a crawl, so an earlier one can skip seeds
+            logger.warning(
+                f"{len(set(seed_urls)) - len(added)} seed URLs were already seen in this "
+                "Redis frontier and were not queued; clear its deepharvest:* keys to crawl "
+                "them again"
+            )
 
         # Start all workers
         worker_tasks = [asyncio.create_task(worker.start()) for worker in self.workers]
@@ -12,6 +12,16 @@ import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
+# Pop up to ARGV[1] items and record each as in progress in the same step, so a
+# worker that dies between the two can't lose them
+_POP_CLAIM_SCRIPT = """
+local popped = redis.call('ZPOPMAX', KEYS[1], ARGV[1])
+for i = 1, #popped, 2 do
+    redis.call('HSET', KEYS[2], cjson.decode(popped[i])['url'], popped[i])
+end
+return popped
+"""
+
 
 class RedisFrontier:
     """
@@ -19,26 +29,42 @@ class RedisFrontier:
     Supports multiple strategies: BFS, DFS, Priority Queue
     """
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, max_connections: int = 10):
         self.redis_url = redis_url
+        self.max_connections = max_connections
         self.redis: Optional[aioredis.Redis] = None
+        self._pool: Optional[aioredis.BlockingConnectionPool] = None
+        self._pop_claim = None  # Registered _POP_CLAIM_SCRIPT, set by connect()
 
         # Redis key prefixes
         self.QUEUE_KEY = "deepharvest:queue"
         self.PRIORITY_QUEUE_KEY = "deepharvest:priority_queue"
         self.VISITED_SET_KEY = "deepharvest:visited"
+        self.SEEN_SET_KEY = "deepharvest:seen"
         self.CONTENT_HASH_KEY = "deepharvest:content_hashes"
-        self.IN_PROGRESS_KEY = "deepharvest:in_progress"
+        # url -> queued item JSON, so claimed URLs can be put back
+        self.IN_PROGRESS_KEY = "deepharvest:in_progress_items"
         self.STATS_KEY = "deepharvest:stats"
         self.LOCKS_KEY = "deepharvest:locks"
 
     async def connect(self):
         """Connect to Redis"""
-        self.redis = await aioredis.from_url(
-            self.redis_url, encoding="utf-8", decode_responses=False  # Handle binary data
+        # Pooled connections so concurrent workers don't serialize on one socket;
+        # the blocking pool waits for a free connection instead of erroring
+        self._pool = aioredis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            encoding="utf-8",
+            decode_responses=False,  # Handle binary data
         )
+        self.redis = aioredis.Redis(connection_pool=self._pool)
+        self._pop_claim = self.redis.register_script(_POP_CLAIM_SCRIPT)
         logger.info("Connected to Redis frontier")
 
+    def pipeline(self):
+        """Non-transactional pipeline for batching commands into one round-trip"""
+        return self.redis.pipeline(transaction=False)
+
     async def add(self, url: str, depth: int, priority: float = 0.5):
         """Add URL to frontier"""
 
@@ -62,38 +88,110 @@ class RedisFrontier:
         # Update stats
         await self.redis.hincrby(self.STATS_KEY, "queued", 1)
 
+    async def add_many(self, items: List[Tuple[str, int, float]]) -> List[Tuple[str, int, float]]:
+        """
+        Add (url, depth, priority) items not seen before by any worker.
+        Returns the items added.
+        """
+
+        if not items:
+            return []
+
+        # Claim each URL in the seen set in one round-trip; SADD returns 1 only for
+        # the worker that added it first, so concurrent workers never both enqueue it
+        async with self.pipeline() as pipe:
+            for url, _, _ in items:
+                pipe.sadd(self.SEEN_SET_KEY, hashlib.sha256(url.encode()).hexdigest())
+            claimed = await pipe.execute()
+
+        added = [item for item, is_new in zip(items, claimed) if is_new]
+        if not added:
+            return []
+
+        added_at = datetime.utcnow().isoformat()
+        mapping = {
+            json.dumps(
+                {"url": url, "depth": depth, "priority": priority, "added_at": added_at}
+            ): priority
+            for url, depth, priority in added
+        }
+
+        async with self.pipeline() as pipe:
+            pipe.zadd(self.PRIORITY_QUEUE_KEY, mapping)
+            pipe.hincrby(self.STATS_KEY, "queued", len(mapping))
+            await pipe.execute()
+
+        return added
+
     async def get(self, timeout: float = 5.0) -> Optional[Tuple[str, int, float]]:
         """Get next URL from frontier (highest priority)"""
 
-        try:
-            # Pop highest priority item
-            result = await self.redis.bzpopmax(self.PRIORITY_QUEUE_KEY, timeout=timeout)
+        items = await self.get_many(1, timeout=timeout)
+        return items[0] if items else None
 
+    async def get_many(self, count: int, timeout: float = 5.0) -> List[Tuple[str, int, float]]:
+        """Get up to count URLs in one round-trip, blocking for the first only if empty"""
+
+        popped = await self._pop_claim(
+            keys=[self.PRIORITY_QUEUE_KEY, self.IN_PROGRESS_KEY], args=[count]
+        )
+        item_jsons = popped[::2]  # ZPOPMAX replies alternate member, score
+
+        if not item_jsons:
+            # Scripts can't block, so wait with BZPOPMAX and claim the item after
+            try:
+                result = await self.redis.bzpopmax(self.PRIORITY_QUEUE_KEY, timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
             if not result:
-                return None
+                return []
 
-            _, item_json, score = result
+            _, item_json, _ = result
             item = json.loads(item_json)
+            await self.redis.hset(self.IN_PROGRESS_KEY, item["url"], item_json)
+            return [(item["url"], item["depth"], item["priority"])]
+
+        items = [json.loads(item_json) for item_json in item_jsons]
+        return [(item["url"], item["depth"], item["priority"]) for item in items]
+
+    async def requeue_in_progress(self) -> int:
+        """
+        Put every in-progress URL back in the queue; returns how many. Call it
+        when a crawl starts, before any worker runs: URLs claimed by a worker
+        that died (fetched, buffered or mid-processing) are otherwise stuck,
+        since they're already in the seen set. A running worker's URLs would be
+        queued a second time, so they'd be crawled twice, never lost.
+        """
 
-            # Add to in-progress set
-            await self.redis.sadd(self.IN_PROGRESS_KEY, item["url"])
+        claimed = await self.redis.hgetall(self.IN_PROGRESS_KEY)
+        if not claimed:
+            return 0
 
-            return item["url"], item["depth"], item["priority"]
+        mapping = {item_json: json.loads(item_json)["priority"] for item_json in claimed.values()}
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.PRIORITY_QUEUE_KEY, mapping)
+            pipe.hdel(self.IN_PROGRESS_KEY, *claimed)
+            await pipe.execute()
 
-        except asyncio.TimeoutError:
-            return None
+        logger.info(f"Requeued {len(mapping)} in-progress URLs")
+        return len(mapping)
 
     async def mark_done(self, url: str):
         """Mark URL as completed"""
 
-        # Remove from in-progress
-        await self.redis.srem(self.IN_PROGRESS_KEY, url)
+        url_hash = hashlib.sha256(url.encode()).hexdigest()
 
-        # Add to visited set
-        await self.mark_visited(url)
+        async with self.pipeline() as pipe:
+            # Remove from in-progress
+            pipe.hdel(self.IN_PROGRESS_KEY, url)
 
-        # Update stats
-        await self.redis.hincrby(self.STATS_KEY, "processed", 1)
+            # Add to visited set
+            pipe.sadd(self.VISITED_SET_KEY, url_hash)
+
+            # Update stats
+            pipe.hincrby(self.STATS_KEY, "processed", 1)
+
+            await pipe.execute()
 
     async def is_visited(self, url: str) -> bool:
         """Check if URL has been visited"""
@@ -133,7 +231,7 @@ class RedisFrontier:
         return {
             "queued": int(stats.get(b"queued", 0)),
             "processed": int(stats.get(b"processed", 0)),
-            "in_progress": await self.redis.scard(self.IN_PROGRESS_KEY),
+            "in_progress": await self.redis.hlen(self.IN_PROGRESS_KEY),
             "visited": await self.redis.scard(self.VISITED_SET_KEY),
         }
 
@@ -160,3 +258,5 @@ class RedisFrontier:
         """Close Redis connection"""
         if self.redis:
             await self.redis.close()
+        if self._pool:
+            await self._pool.disconnect()
@@ -22,6 +22,10 @@ class StorageBackend:
     async def store(self, url: str, content: Dict, metadata: Dict, response):
         raise NotImplementedError
 
+    async def close(self):
+        """Release connections/handles held by the backend"""
+        pass
+
 
 class FileSystemStorage(StorageBackend):
     """Local filesystem storage"""
@@ -139,6 +143,10 @@ class PostgresStorage(StorageBackend):
             )
             self.conn.commit()
 
+    async def close(self):
+        """Close database connection"""
+        self.conn.close()
+
 
 # Factory function
 def create_storage_backend(config) -> StorageBackend:
@@ -39,7 +39,9 @@ class Worker:
 
         from .redis_frontier import RedisFrontier
 
-        self.frontier = RedisFrontier(self.config.redis_url)
+        self.frontier = RedisFrontier(
+            self.config.redis_url, max_connections=self.config.concurrent_requests
+        )
         await self.frontier.connect()
         self.running = True
 
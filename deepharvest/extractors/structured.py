@@ -2,6 +2,7 @@
 structured.py - JSON-LD, microdata, OpenGraph
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 import json
@@ -15,7 +16,11 @@ class StructuredDataExtractor:
     """Extract structured data from HTML"""
 
     async def extract(self, response) -> Dict[str, Any]:
-        """Extract all structured data"""
+        """Extract all structured data (parsing runs in a worker thread)"""
+        return await asyncio.to_thread(self.extract_sync, response)
+
+    def extract_sync(self, response) -> Dict[str, Any]:
+        """Extract all structured data, blocking the calling thread"""
         result = {"jsonld": [], "microdata": {}, "opengraph": {}, "twitter": {}}
 
         try:
@@ -2,6 +2,7 @@
 text.py - Text extraction & normalization
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 from bs4 import BeautifulSoup
@@ -14,7 +15,11 @@ class TextExtractor:
     """Extract and normalize text from HTML"""
 
     async def extract(self, response) -> Dict[str, Any]:
-        """Extract text content from response"""
+        """Extract text content from response (parsing runs in a worker thread)"""
+        return await asyncio.to_thread(self.extract_sync, response)
+
+    def extract_sync(self, response) -> Dict[str, Any]:
+        """Extract text content from response, blocking the calling thread"""
         from ..multilingual.language import LanguageDetector
 
         result = {
@@ -28,7 +33,7 @@ class TextExtractor:
         }
 
         # Detect encoding
-        encoding = await self._detect_encoding(response.content)
+        encoding = self._detect_encoding(response.content)
 
         # Parse HTML
         html = response.content.decode(encoding, errors="ignore")
@@ -64,11 +69,11 @@ class TextExtractor:
 
         # Detect language
         detector = LanguageDetector()
-        result["language"] = await detector.detect(result["text"])
+        result["language"] = detector.detect_sync(result["text"])
 
         return result
 
-    async def _detect_encoding(self, content: bytes) -> str:
+    def _detect_encoding(self, content: bytes) -> str:
         """Detect content encoding"""
         detected = chardet.detect(content)
         return detected.get("encoding", "utf-8") or "utf-8"
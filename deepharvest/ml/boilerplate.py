@@ -29,6 +29,10 @@ class BoilerplateRemover:
             "#sidebar",
         ]
 
+    async def load(self):
+        """Load model"""
+        logger.info("Boilerplate remover loaded")
+
     def remove_boilerplate(self, html: str) -> str:
         """Remove boilerplate from HTML"""
         soup = BeautifulSoup(html, "lxml")
@@ -2,6 +2,7 @@
 Page Type Classification using ML
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional
 import numpy as np
@@ -63,6 +64,11 @@ class PageClassifier:
         Returns:
             Dict mapping page types to confidence scores (0.0-1.0)
         """
+        # Feature extraction parses the HTML; keep it off the event loop
+        return await asyncio.to_thread(self._classify_sync, html, url)
+
+    def _classify_sync(self, html: str, url: str) -> Dict[str, float]:
+        """Blocking implementation of classify()"""
         try:
             features = self._extract_features(html, url)
 
@@ -276,16 +282,8 @@ class PageClassifier:
         Returns:
             Page type string
         """
-        import asyncio
-
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If loop is running, we need to use a different approach
-                # For now, use heuristics directly
-                scores = self._heuristic_classification(html, url)
-            else:
-                scores = loop.run_until_complete(self.classify(html, url))
+            scores = self._classify_sync(html, url)
         except:
             scores = self._heuristic_classification(html, url)
 
@@ -2,11 +2,14 @@
 Soft 404 Detection
 """
 
+import html
 import logging
-from bs4 import BeautifulSoup
+import re
 
 logger = logging.getLogger(__name__)
 
+HARD_404_STATUS_CODES = frozenset({404, 410})
+
 
 class Soft404Detector:
     """Detect soft 404 pages (pages that return 200 but are actually errors)"""
@@ -21,6 +24,18 @@ class Soft404Detector:
         "the page you are looking for",
     ]
 
+    # Titles and error messages sit near the top; only this much text is scanned
+    SCAN_PREFIX_CHARS = 16384
+
+    # Indicators are ASCII, so scanning UTF-8 bytes with bytes.lower() avoids
+    # Unicode-aware lowercasing of wide (non-ASCII) strings. A few short literals
+    # scan fastest as separate `in` checks, ahead of a regex or Aho-Corasick.
+    _INDICATORS = tuple(indicator.encode() for indicator in SOFT_404_INDICATORS)
+    _SHORT_PAGE_INDICATORS = (b"not found", b"404 error")
+
+    _TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title", re.S)
+    _TITLE_INDICATOR_RE = re.compile("404|not found|error")
+
     async def load(self):
         """Load model"""
         logger.info("Soft 404 detector loaded")
@@ -33,45 +48,43 @@ class Soft404Detector:
 
         # Check status code
         status_code = getattr(response, "status_code", None)
-        if status_code in [404, 410]:
+        if status_code in HARD_404_STATUS_CODES:
             return True
 
+        # Only HTML/XML documents can be error pages; skip images, JSON, CSS, ...
+        headers = getattr(response, "headers", None) or {}
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        if content_type and content_type != "text/html" and not content_type.endswith("xml"):
+            return False
+
         # Check content
         if not hasattr(response, "text") or not response.text:
             return False
 
-        text = response.text.lower()
+        length = len(response.text)
+        data = response.text[: self.SCAN_PREFIX_CHARS].encode("utf-8", "replace").lower()
 
         # Require longer content to avoid false positives
-        if len(text) < 200:
+        if length < 200:
             # Very short pages with specific error indicators
-            if any(indicator in text for indicator in ["page not found", "404 error", "not found"]):
-                return True
-            return False
-
-        # Count specific indicators (not generic words like "error")
-        indicator_count = sum(1 for indicator in self.SOFT_404_INDICATORS if indicator in text)
-
-        # Require multiple indicators for longer pages
-        if len(text) < 1000 and indicator_count >= 2:
-            return True
-
-        if indicator_count >= 3:
-            return True
-
-        # Check title - more specific
-        try:
-            soup = BeautifulSoup(response.text, "lxml")
-            title = soup.find("title")
-
-            if title:
-                title_text = title.get_text().lower()
-                if any(
-                    indicator in title_text
-                    for indicator in ["404", "not found", "page not found", "error"]
-                ):
+            return any(indicator in data for indicator in self._SHORT_PAGE_INDICATORS)
+
+        # Count specific indicators (not generic words like "error"); longer pages
+        # need more of them, and scanning stops as soon as there are enough
+        required = 2 if length < 1000 else 3
+        indicator_count = 0
+        for indicator in self._INDICATORS:
+            if indicator in data:
+                indicator_count += 1
+                if indicator_count >= required:
                     return True
-        except:
-            pass
+
+        # Check title - more specific. A regex over the already-lowercased text
+        # avoids building a full parse tree just to read one element.
+        title = self._TITLE_RE.search(data)
+        if title:
+            title_text = html.unescape(title.group(1).decode("utf-8", "replace")).lower()
+            if self._TITLE_INDICATOR_RE.search(title_text):
+                return True
 
         return False
@@ -13,6 +13,10 @@ class LanguageDetector:
 
     async def detect(self, text: str) -> str:
         """Detect primary language"""
+        return self.detect_sync(text)
+
+    def detect_sync(self, text: str) -> str:
+        """Detect primary language, for callers already off the event loop"""
         try:
             return detect(text)
         except:
@@ -0,0 +1,36 @@
+"""
+atomic.py - Crash-safe file replacement
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+# mkstemp always creates files as 0600; give replacements the mode open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def write_atomic(path: Union[str, Path], data: bytes):
+    """
+    Replace path with data (blocking). The data goes to a unique temp file in the
+    same directory, is fsync'd, then renamed over path, so readers only ever see
+    the old or the new contents and concurrent writers never share a temp file.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, _FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,134 @@
+"""
+bloom.py - Bloom filters for compact URL membership checks
+"""
+
+import math
+import struct
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import mmh3
+
+from .atomic import write_atomic
+
+# magic, number of bits, number of hash functions, items added, generation
+_HEADER = struct.Struct(">4sQIQQ")
+_MAGIC = b"DHBF"
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter using Kirsch-Mitzenmacher double hashing.
+
+    Memory is ~1.2 bytes per expected item at a 1% error rate. When a filename
+    is given, an existing filter of the same sizing is loaded from it, and
+    flush() atomically replaces the file with the current bits, so the file
+    only ever holds a state that was explicitly saved.
+
+    With track_changes, items newly added are also appended to changes, so a
+    caller can persist just those and write the whole bit array only rarely.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.01,
+        filename: Optional[Union[str, Path]] = None,
+        track_changes: bool = False,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.filename = Path(filename) if filename else None
+
+        self._count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        # Items added since the caller last trimmed it (track_changes only)
+        self.changes: Optional[List[str]] = [] if track_changes else None
+
+        if self.filename is not None:
+            self.load(self.filename)
+
+    def _positions(self, item: str):
+        h1, h2 = mmh3.hash64(item, signed=False)
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> bool:
+        """Add item. Returns False if it was (probably) already present."""
+        bits = self._bits
+        added = False
+        for pos in self._positions(item):
+            idx = pos >> 3
+            mask = 1 << (pos & 7)
+            if not bits[idx] & mask:
+                bits[idx] |= mask
+                added = True
+        if added:
+            self._count += 1
+            if self.changes is not None:
+                self.changes.append(item)
+        return added
+
+    def update(self, items: Iterable[str]):
+        """Add every item"""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        """Approximate number of distinct items added"""
+        return self._count
+
+    def snapshot(self, generation: int = 0) -> bytes:
+        """
+        Header and bit array as of now, in the format flush() writes. The bits
+        are copied in one C call under the GIL, so a thread can take the
+        snapshot while the event loop keeps adding.
+        """
+        header = _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self._count, generation)
+        return header + self._bits
+
+    def write_snapshot(self, data: bytes, filename: Optional[Union[str, Path]] = None):
+        """Atomically replace filename (default: the filter's file) with a snapshot()"""
+        filename = Path(filename) if filename else self.filename
+        if filename is None:
+            return
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(filename, data)
+
+    def load(self, filename: Union[str, Path], generation: Optional[int] = None) -> bool:
+        """
+        Replace the contents with a snapshot saved in filename. Returns False
+        (leaving the filter untouched) if the file is missing, was written for
+        a different sizing, or isn't the expected generation.
+        """
+        try:
+            data = Path(filename).read_bytes()
+        except FileNotFoundError:
+            return False
+        if len(data) != _HEADER.size + len(self._bits):
+            return False
+
+        magic, num_bits, num_hashes, count, saved_generation = _HEADER.unpack_from(data)
+        if (magic, num_bits, num_hashes) != (_MAGIC, self.num_bits, self.num_hashes):
+            return False
+        if generation is not None and saved_generation != generation:
+            return False
+
+        self._bits[:] = memoryview(data)[_HEADER.size :]
+        self._count = count
+        return True
+
+    def flush(self):
+        """Persist the filter to its file (no-op for in-memory filters)"""
+        if self.filename is not None:
+            self.write_snapshot(self.snapshot())
+
+    def close(self):
+        """Flush to the backing file"""
+        self.flush()
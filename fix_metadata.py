@@ -1,47 +1,60 @@
+import copy
 import zipfile
 import tarfile
 import gzip
 import io
 import os
 import shutil
+import struct
+
+SKIP_PREFIXES = ('Dynamic: license-file', 'License-File:')
 
 def fix_metadata_content(metadata):
     """Fix metadata by removing problematic fields"""
-    lines = metadata.split('\n')
-    new_lines = []
-    for l in lines:
-        l = l.rstrip('\r')
-        if l.startswith('License-Expression:'):
-            new_lines.append('License: Apache-2.0')
-        elif l.startswith('Dynamic: license-file'):
-            continue
-        elif l.startswith('License-File:'):
-            continue
-        else:
-            new_lines.append(l)
-    
-    new_metadata = '\n'.join(new_lines)
-    if not new_metadata.endswith('\n'):
-        new_metadata += '\n'
-    return new_metadata
+    # splitlines() also drops the '\r' of CRLF line endings
+    new_lines = [
+        'License: Apache-2.0' if l.startswith('License-Expression:') else l
+        for l in metadata.splitlines()
+        if not l.startswith(SKIP_PREFIXES)
+    ]
+    return '\n'.join(new_lines) + '\n'
+
+def copy_zip_entry_raw(z, z2, info):
+    """Copy one entry's compressed bytes verbatim, without inflating/deflating"""
+    # Skip the source local header (its name/extra lengths can differ from the
+    # central directory's) to reach the compressed data
+    z.fp.seek(info.header_offset)
+    header = z.fp.read(zipfile.sizeFileHeader)
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    z.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    data = z.fp.read(info.compress_size)
+
+    out = copy.copy(info)
+    out.flag_bits &= ~0x08  # CRC and sizes go in the local header, no data descriptor
+    out.header_offset = z2.fp.tell()
+    z2.fp.write(out.FileHeader())
+    z2.fp.write(data)
+    z2.filelist.append(out)
+    z2.NameToInfo[out.filename] = out
+    z2.start_dir = z2.fp.tell()
+    z2._didModify = True
 
 # Fix wheel
 if os.path.exists('dist/deepharvest-1.0.0-py3-none-any.whl'):
-    z = zipfile.ZipFile('dist/deepharvest-1.0.0-py3-none-any.whl', 'r')
-    files = z.namelist()
-    metadata_file = [f for f in files if 'METADATA' in f][0]
-    metadata = z.read(metadata_file).decode('utf-8')
-    new_metadata = fix_metadata_content(metadata)
-
     temp_whl = 'dist/deepharvest-1.0.0-py3-none-any.whl.tmp'
-    z2 = zipfile.ZipFile(temp_whl, 'w', zipfile.ZIP_DEFLATED)
-    for f in files:
-        if f == metadata_file:
-            z2.writestr(f, new_metadata.encode('utf-8'))
-        else:
-            z2.writestr(f, z.read(f))
-    z2.close()
-    z.close()
+    with zipfile.ZipFile('dist/deepharvest-1.0.0-py3-none-any.whl', 'r') as z, \
+            zipfile.ZipFile(temp_whl, 'w', zipfile.ZIP_DEFLATED) as z2:
+        infos = z.infolist()
+        metadata_file = [i.filename for i in infos if 'METADATA' in i.filename][0]
+        for info in infos:
+            if info.filename == metadata_file:
+                # Only METADATA changes, so it's the only entry recompressed
+                new_metadata = fix_metadata_content(z.read(info).decode('utf-8'))
+                out = copy.copy(info)
+                out.compress_type = zipfile.ZIP_DEFLATED
+                z2.writestr(out, new_metadata.encode('utf-8'))
+            else:
+                copy_zip_entry_raw(z, z2, info)
     os.replace(temp_whl, 'dist/deepharvest-1.0.0-py3-none-any.whl')
     print('Fixed wheel METADATA')
 else:
@@ -49,36 +62,22 @@ else:
 
 # Fix tar.gz
 if os.path.exists('dist/deepharvest-1.0.0.tar.gz'):
-    t = tarfile.open('dist/deepharvest-1.0.0.tar.gz', 'r:gz')
-    members = t.getmembers()
-    pkg_info = [m for m in members if 'PKG-INFO' in m.name][0]
-    pkg_info_content = t.extractfile(pkg_info).read().decode('utf-8')
-    new_pkg_info = fix_metadata_content(pkg_info_content)
-    t.close()
-    
-    # Create new tar.gz
+    # Single pass: copy members in order, patching PKG-INFO on the way through
     temp_tar = 'dist/deepharvest-1.0.0.tar.gz.new'
-    t2 = tarfile.open(temp_tar, 'w:gz')
-    t = tarfile.open('dist/deepharvest-1.0.0.tar.gz', 'r:gz')
-    for m in members:
-        if m.name == pkg_info.name:
-            info = tarfile.TarInfo(name=m.name)
-            info.size = len(new_pkg_info.encode('utf-8'))
-            info.mode = m.mode
-            info.mtime = m.mtime
-            t2.addfile(info, io.BytesIO(new_pkg_info.encode('utf-8')))
-        else:
-            t2.addfile(m, t.extractfile(m))
-    t2.close()
-    t.close()
-    
-    # Replace old file
-    import time
-    time.sleep(0.1)  # Brief pause to ensure file handles are closed
-    if os.path.exists('dist/deepharvest-1.0.0.tar.gz'):
-        os.remove('dist/deepharvest-1.0.0.tar.gz')
-    os.rename(temp_tar, 'dist/deepharvest-1.0.0.tar.gz')
+    with tarfile.open('dist/deepharvest-1.0.0.tar.gz', 'r:gz') as t, \
+            tarfile.open(temp_tar, 'w:gz') as t2:
+        for m in t:
+            if m.isfile() and os.path.basename(m.name) == 'PKG-INFO':
+                pkg_info = t.extractfile(m).read().decode('utf-8')
+                data = fix_metadata_content(pkg_info).encode('utf-8')
+                info = copy.copy(m)
+                info.size = len(data)
+                t2.addfile(info, io.BytesIO(data))
+            else:
+                t2.addfile(m, t.extractfile(m) if m.isfile() else None)
+
+    # Both archives are closed by the with-block, so the swap is safe
+    os.replace(temp_tar, 'dist/deepharvest-1.0.0.tar.gz')
     print('Fixed tar.gz PKG-INFO')
 else:
     print('tar.gz not found, skipping')
-
@@ -102,6 +102,13 @@ setup(
             "torch>=2.1.0",  # For advanced ML models
             "transformers>=4.35.0",  # For LLM-based extraction
         ],
+        "fast": [
+            "uvloop>=0.19.0; sys_platform != 'win32'",  # libuv event loop
+            "orjson>=3.9.0",  # Fast checkpoint serialization
+        ],
+        "http2": [
+            "httpx[http2]>=0.25.0",  # Multiplexed HTTP/2 fetching
+        ],
     },
     entry_points={
         "console_scripts": [
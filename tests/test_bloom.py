@@ -0,0 +1,79 @@
+"""
+Test Bloom filter membership and persistence
+"""
+import tempfile
+from pathlib import Path
+from deepharvest.utils.bloom import BloomFilter
+
+class TestBloomFilter:
+    """Test Bloom filter"""
+
+    def test_add_and_contains(self):
+        """Test added items are reported present"""
+        bloom = BloomFilter(capacity=1000)
+        assert bloom.add("https://example.com/a")
+        assert not bloom.add("https://example.com/a")
+        assert "https://example.com/a" in bloom
+        assert "https://example.com/b" not in bloom
+        assert len(bloom) == 1
+
+    def test_false_positive_rate(self):
+        """Test false positive rate stays near the configured bound"""
+        bloom = BloomFilter(capacity=10000, error_rate=0.01)
+        bloom.update(f"https://example.com/page/{i}" for i in range(10000))
+        false_positives = sum(f"https://other.com/{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_file_backed_reopen(self):
+        """Test file-backed filter restores its contents on reopen"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "visited.bloom"
+            bloom = BloomFilter(capacity=1000, filename=path)
+            bloom.add("https://example.com/a")
+            bloom.close()
+
+            reopened = BloomFilter(capacity=1000, filename=path)
+            assert "https://example.com/a" in reopened
+            assert len(reopened) == 1
+            reopened.close()
+
+            # Different sizing starts from an empty filter
+            resized = BloomFilter(capacity=5000, filename=path)
+            assert "https://example.com/a" not in resized
+            resized.close()
+
+    def test_file_holds_last_flush(self):
+        """Test the file only changes on flush, so it never runs ahead of a save"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "visited.bloom"
+            bloom = BloomFilter(capacity=1000, filename=path)
+            bloom.add("https://example.com/a")
+            bloom.flush()
+            bloom.add("https://example.com/b")  # Never flushed, as after a crash
+
+            reopened = BloomFilter(capacity=1000, filename=path)
+            assert "https://example.com/a" in reopened
+            assert "https://example.com/b" not in reopened
+            assert len(reopened) == 1
+
+    def test_track_changes(self):
+        """Test only newly added items are recorded as changes"""
+        bloom = BloomFilter(capacity=1000, track_changes=True)
+        bloom.update(["https://example.com/a", "https://example.com/b", "https://example.com/a"])
+        assert bloom.changes == ["https://example.com/a", "https://example.com/b"]
+        assert BloomFilter(capacity=1000).changes is None
+
+    def test_load_checks_generation(self):
+        """Test snapshots load only into a filter of the same sizing and generation"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "visited.bloom"
+            bloom = BloomFilter(capacity=1000)
+            bloom.add("https://example.com/a")
+            bloom.write_snapshot(bloom.snapshot(generation=2), path)
+
+            assert not BloomFilter(capacity=1000).load(path, generation=1)
+            assert not BloomFilter(capacity=5000).load(path)
+            loaded = BloomFilter(capacity=1000)
+            assert loaded.load(path, generation=2)
+            assert "https://example.com/a" in loaded
+            assert len(loaded) == 1
@@ -5,9 +5,12 @@ Test resume functionality
 import pytest
 import asyncio
 import json
+import os
+import stat
 import tempfile
 from pathlib import Path
-from deepharvest.core.crawler import DeepHarvest, CrawlConfig, CrawlStrategy
+from concurrent.futures import ThreadPoolExecutor
+from deepharvest.core.crawler import DeepHarvest, CrawlConfig, CrawlStrategy, _write_checkpoint
 from deepharvest.core.frontier import LocalFrontier
 
 
@@ -151,6 +154,235 @@ class TestResumeFunctionality:
 
             await crawler.shutdown()
 
+    def test_overlapping_checkpoint_writes(self):
+        """Test concurrent checkpoint writes never clobber each other's temp file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for round_ in range(50):
+                    writes = [
+                        pool.submit(_write_checkpoint, state_file, {"processed": round_, "w": i})
+                        for i in range(4)
+                    ]
+                    for write in writes:
+                        write.result()  # Raises if any write failed
+
+                    with open(state_file) as f:
+                        assert json.load(f)["processed"] == round_
+
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["test_state.json"]
+
+    def test_checkpoint_file_mode(self):
+        """Test checkpoints get the umask's default mode, not the temp file's 0600"""
+        umask = os.umask(0)
+        os.umask(umask)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+            _write_checkpoint(state_file, {"processed": 1})
+            assert stat.S_IMODE(state_file.stat().st_mode) == 0o666 & ~umask
+
+    @pytest.mark.asyncio
+    async def test_overlapping_checkpoint_saves(self):
+        """Test checkpoints saved at the same time all succeed and leave valid state"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                max_depth=2,
+                state_file=str(state_file),
+                enable_js=False,
+            )
+
+            crawler = DeepHarvest(config)
+            await crawler.initialize()
+            await crawler.frontier.add("https://example.com/page1", depth=1, priority=0.8)
+
+            await asyncio.gather(*(crawler._save_checkpoint() for _ in range(8)))
+
+            with open(state_file) as f:
+                state = json.load(f)
+            assert state["frontier"][0]["url"] == "https://example.com/page1"
+
+            await crawler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_resume_after_crash_requeues_later_urls(self):
+        """Test URLs found after the last checkpoint are crawlable after a crash"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                max_depth=2,
+                state_file=str(state_file),
+                enable_js=False,
+            )
+
+            crawler = DeepHarvest(config)
+            await crawler.initialize()
+            await crawler.frontier.add_many([("https://example.com/page1", 1, 0.8)])
+            await crawler._save_checkpoint()
+
+            # Found after the checkpoint; the process then dies without shutdown()
+            await crawler.frontier.add_many([("https://example.com/page2", 1, 0.8)])
+            await crawler.fetcher.close()
+
+            resumed = DeepHarvest(config)
+            await resumed.initialize()
+            assert resumed._frontier_restored is True
+            assert "https://example.com/page1" in resumed.visited
+            assert "https://example.com/page2" not in resumed.visited
+
+            added = await resumed.frontier.add_many([("https://example.com/page2", 1, 0.8)])
+            assert [item[0] for item in added] == ["https://example.com/page2"]
+
+            await resumed.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_includes_buffered_urls(self):
+        """Test URLs the pump took from the frontier are checkpointed and handed back"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                max_depth=2,
+                state_file=str(state_file),
+                enable_js=False,
+            )
+
+            crawler = DeepHarvest(config)
+            await crawler.initialize()
+            urls = [f"https://example.com/page{i}" for i in range(3)]
+            await crawler.frontier.add_many([(url, 1, 0.5) for url in urls])
+
+            # A full local queue leaves the pump holding the rest of its batch
+            crawler._local_q = asyncio.Queue(maxsize=1)
+            pump = asyncio.create_task(crawler._frontier_pump(1))
+            await asyncio.sleep(0.05)
+
+            await crawler._save_checkpoint()
+            with open(state_file) as f:
+                state = json.load(f)
+            assert sorted(item["url"] for item in state["frontier"]) == urls
+
+            pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+            pending = [item["url"] for item in await crawler.frontier.get_pending_snapshot()]
+            assert sorted(pending + [crawler._local_q.get_nowait()[0]]) == urls
+
+            await crawler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_pump_cancel_keeps_popped_urls(self):
+        """Test cancelling the pump mid-get_many hands the popped URLs back"""
+
+        class SlowFrontier(LocalFrontier):
+            async def get_many(self, count, timeout=1.0):
+                items = await super().get_many(count, timeout)
+                await asyncio.sleep(0.1)  # Popped, but not yet returned
+                return items
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                state_file=str(Path(tmpdir) / "test_state.json"),
+            )
+            crawler = DeepHarvest(config)
+            crawler.frontier = SlowFrontier(CrawlStrategy.BFS)
+            await crawler.frontier.add_many([("https://example.com/page1", 1, 0.5)])
+
+            crawler._local_q = asyncio.Queue(maxsize=4)
+            pump = asyncio.create_task(crawler._frontier_pump(1))
+            await asyncio.sleep(0.05)
+            pump.cancel()
+            await asyncio.gather(pump, return_exceptions=True)
+
+            pending = await crawler.frontier.get_pending_snapshot()
+            assert [item["url"] for item in pending] == ["https://example.com/page1"]
+
+    @pytest.mark.asyncio
+    async def test_failed_initialize_cancels_other_startups(self):
+        """Test a failing subsystem init cancels the others and closes the fetcher"""
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow_init():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failing_init():
+            await started.wait()
+            raise RuntimeError("exporter failed")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                state_file=str(Path(tmpdir) / "test_state.json"),
+                enable_js=False,
+            )
+            crawler = DeepHarvest(config)
+            crawler._initialize_extractors = slow_init
+            crawler._initialize_exporters = failing_init
+
+            with pytest.raises(RuntimeError, match="exporter failed"):
+                await crawler.initialize()
+            assert cancelled == [True]
+            assert crawler.fetcher.session is None
+
+    @pytest.mark.asyncio
+    async def test_visited_filter_saved_by_generation(self):
+        """Test checkpoints list recent URLs and save the whole filter only when they pile up"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "test_state.json"
+
+            config = CrawlConfig(
+                seed_urls=["https://example.com"],
+                max_depth=2,
+                state_file=str(state_file),
+                enable_js=False,
+                expected_urls=10_000,
+            )
+
+            crawler = DeepHarvest(config)
+            await crawler.initialize()
+            await crawler.frontier.add_many([("https://example.com/page0", 1, 0.5)])
+            await crawler._save_checkpoint()
+            assert not list(Path(tmpdir).glob("*.bloom*"))  # Small crawls only list URLs
+
+            urls = [f"https://example.com/page{i}" for i in range(1, 1500)]
+            await crawler.frontier.add_many([(url, 1, 0.5) for url in urls])
+            await crawler._save_checkpoint()  # Lists them all, then saves generation 1
+            assert (Path(tmpdir) / "test_state.bloom.1").exists()
+
+            # Found after the filter was saved; the process dies before the next
+            # checkpoint, so the state file still builds on no saved filter
+            await crawler.frontier.add_many([("https://example.com/late", 1, 0.5)])
+            await crawler.fetcher.close()
+
+            resumed = DeepHarvest(config)
+            await resumed.initialize()
+            assert all(url in resumed.visited for url in urls)
+            assert "https://example.com/late" not in resumed.visited
+
+            await resumed._save_checkpoint()  # Replayed URLs pile up again: generation 1
+            await resumed._save_checkpoint()
+            with open(state_file) as f:
+                state = json.load(f)
+            assert state["visited_base"] == 1
+            assert state["visited"] == []
+            await resumed.shutdown()
+
+            again = DeepHarvest(config)
+            await again.initialize()
+            assert all(url in again.visited for url in urls)
+            await again.shutdown()
+
     @pytest.mark.asyncio
     async def test_backward_compatibility_no_frontier(self):
         """Test that old checkpoints without frontier data still work"""
@@ -254,3 +486,121 @@ class TestResumeFunctionality:
         urls_restored = [item1[0], item2[0]]
         assert "https://example.com/page1" in urls_restored
         assert "https://example.com/page2" in urls_restored
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_add_many_skips_seen(self):
+        """Test add_many only enqueues URLs not seen before"""
+        seen = {"https://example.com/visited"}
+        frontier = LocalFrontier(CrawlStrategy.BFS, seen=seen)
+
+        added = await frontier.add_many(
+            [
+                ("https://example.com/visited", 1, 0.5),
+                ("https://example.com/new", 1, 0.5),
+                ("https://example.com/new", 2, 0.5),
+            ]
+        )
+
+        assert added == [("https://example.com/new", 1, 0.5)]
+        assert "https://example.com/new" in seen
+        assert await frontier.add_many([("https://example.com/new", 1, 0.5)]) == []
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_order(self):
+        """Test BFS pops oldest first and DFS newest first, across buffer growth"""
+        urls = [f"https://example.com/page{i}" for i in range(3000)]
+
+        bfs = LocalFrontier(CrawlStrategy.BFS)
+        dfs = LocalFrontier(CrawlStrategy.DFS)
+        for frontier in (bfs, dfs):
+            await frontier.add_many([(url, 1, 0.5) for url in urls])
+
+        assert [item[0] for item in await bfs.get_many(len(urls))] == urls
+        assert [item[0] for item in await dfs.get_many(len(urls))] == urls[::-1]
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_priority_order(self):
+        """Test PRIORITY strategy pops highest priority first, shallower on ties"""
+        frontier = LocalFrontier(CrawlStrategy.PRIORITY)
+        await frontier.add_many(
+            [
+                ("https://example.com/low", 1, 0.2),
+                ("https://example.com/deep", 3, 0.9),
+                ("https://example.com/high", 1, 0.9),
+                ("https://example.com/mid", 2, 0.5),
+            ]
+        )
+
+        items = await frontier.get_many(4)
+        assert [item[0] for item in items] == [
+            "https://example.com/high",
+            "https://example.com/deep",
+            "https://example.com/mid",
+            "https://example.com/low",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_priority_signed(self):
+        """Test PRIORITY ordering across negative and zero priorities, FIFO on full ties"""
+        frontier = LocalFrontier(CrawlStrategy.PRIORITY)
+        await frontier.add("https://example.com/neg", 1, -0.5)
+        await frontier.add_many(
+            [
+                ("https://example.com/zero", 1, 0.0),
+                ("https://example.com/negzero", 1, -0.0),
+                ("https://example.com/big", 1, 2.5),
+                ("https://example.com/neg2", 1, -3.0),
+            ]
+        )
+
+        items = await frontier.get_many(5)
+        assert [item[0] for item in items] == [
+            "https://example.com/big",
+            "https://example.com/zero",
+            "https://example.com/negzero",
+            "https://example.com/neg",
+            "https://example.com/neg2",
+        ]
+        assert items[3] == ("https://example.com/neg", 1, -0.5)
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_snapshot_in_place(self):
+        """Test snapshot keeps FIFO order and leaves the queue untouched"""
+        frontier = LocalFrontier(CrawlStrategy.BFS)
+        urls = [f"https://example.com/page{i}" for i in range(5)]
+        await frontier.add_many([(url, 1, 0.5) for url in urls])
+        await frontier.get()  # Advance the head cursor
+
+        snapshot = await frontier.get_pending_snapshot()
+        assert [item["url"] for item in snapshot] == urls[1:]
+        assert await frontier.get_pending_snapshot() == snapshot
+        assert [item[0] for item in await frontier.get_many(10)] == urls[1:]
+
+    @pytest.mark.asyncio
+    async def test_restored_urls_are_seen(self):
+        """Test restored URLs are not queued again when rediscovered"""
+        frontier = LocalFrontier(CrawlStrategy.BFS)
+        await frontier.restore_pending(
+            [{"url": "https://example.com/page1", "depth": 1, "priority": 0.8}]
+        )
+
+        added = await frontier.add_many(
+            [("https://example.com/page1", 2, 0.5), ("https://example.com/page2", 2, 0.5)]
+        )
+        assert [item[0] for item in added] == ["https://example.com/page2"]
+
+    @pytest.mark.asyncio
+    async def test_local_frontier_get_wakes_on_add_and_stop(self):
+        """Test a blocked get() returns as soon as a URL is added or the frontier stops"""
+        frontier = LocalFrontier(CrawlStrategy.BFS)
+
+        waiter = asyncio.create_task(frontier.get(timeout=None))
+        await asyncio.sleep(0)
+        await frontier.add_many([("https://example.com/page1", 1, 0.5)])
+        item = await asyncio.wait_for(waiter, timeout=0.5)
+        assert item[0] == "https://example.com/page1"
+
+        waiter = asyncio.create_task(frontier.get(timeout=None))
+        await asyncio.sleep(0)
+        frontier.stop()
+        assert await asyncio.wait_for(waiter, timeout=0.5) is None
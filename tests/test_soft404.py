@@ -0,0 +1,71 @@
+"""
+Test soft 404 detection
+"""
+import pytest
+from deepharvest.ml.soft404 import Soft404Detector
+
+class MockResponse:
+    """Minimal response with status code, headers and text"""
+
+    def __init__(self, text="", status_code=200, content_type="text/html"):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {"content-type": content_type}
+
+FILLER = "<p>" + "Lorem ipsum dolor sit amet. " * 50 + "</p>"
+
+class TestSoft404Detector:
+    """Test soft 404 detector"""
+
+    @pytest.mark.asyncio
+    async def test_status_code(self):
+        """Test real 404/410 status codes are reported"""
+        detector = Soft404Detector()
+        assert await detector.is_soft_404(MockResponse(status_code=404))
+        assert await detector.is_soft_404(MockResponse(status_code=410))
+
+    @pytest.mark.asyncio
+    async def test_short_page(self):
+        """Test short pages need a specific error phrase"""
+        detector = Soft404Detector()
+        assert await detector.is_soft_404(MockResponse("<h1>Page Not Found</h1>"))
+        assert not await detector.is_soft_404(MockResponse("<h1>Welcome</h1>"))
+
+    @pytest.mark.asyncio
+    async def test_indicator_count(self):
+        """Test longer pages need several distinct indicators"""
+        detector = Soft404Detector()
+        # "page not found" also counts as "not found", plus "does not exist"
+        medium = "<h1>Page not found</h1><p>This resource does not exist.</p>" + "x " * 100
+        assert await detector.is_soft_404(MockResponse(medium))
+
+        article = "<html><head><title>Guide</title></head><body>" + FILLER
+        assert not await detector.is_soft_404(MockResponse(article + "not found</body></html>"))
+
+    @pytest.mark.asyncio
+    async def test_title(self):
+        """Test error titles are detected on long pages"""
+        detector = Soft404Detector()
+        page = "<html><head><title>Oops &ndash; 404</title></head><body>" + FILLER
+        assert await detector.is_soft_404(MockResponse(page + "</body></html>"))
+
+    @pytest.mark.asyncio
+    async def test_scans_prefix_only(self):
+        """Test indicators past the scanned prefix are ignored"""
+        detector = Soft404Detector()
+        tail = "page not found. this page does not exist. no longer available."
+        page = "<html><body>" + FILLER * 20 + tail + "</body></html>"
+        assert len(page) - len(tail) > Soft404Detector.SCAN_PREFIX_CHARS
+        assert not await detector.is_soft_404(MockResponse(page))
+        assert await detector.is_soft_404(MockResponse("<html><body>" + tail + FILLER * 20))
+
+    @pytest.mark.asyncio
+    async def test_non_html_skipped(self):
+        """Test non-HTML bodies are never reported as soft 404s"""
+        detector = Soft404Detector()
+        body = '{"error": "page not found"}'
+        assert not await detector.is_soft_404(MockResponse(body, content_type="application/json"))
+        assert await detector.is_soft_404(
+            MockResponse(body, content_type="text/html; charset=utf-8")
+        )
+        assert await detector.is_soft_404(MockResponse(body, content_type="application/xhtml+xml"))